@@ -0,0 +1,241 @@
+# Advent of Code 2025 - Benchmarks - Throughput and peak memory of every engine
+# Done by: johanaxel007
+#
+# Run from the repository root:
+#   python -m Benchmarks.benchmark --day 1 --sizes 1000 100000 --output benchmark_results.json
+
+import argparse
+import gc
+import importlib.util
+import json
+import platform
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import Day01.main_day01 as day01
+import Day02.main_day02 as day02
+from Benchmarks.generators import format_product_id_ranges, generate_product_id_ranges, write_rotations
+
+# A Day01 size needs about 50 bytes of memory per rotation (5 GB at 10^8): 8 for the compiled rotations the engines share,
+# and up to 41 while the vectorized engines run. The parsers read the log back from a temporary file in bounded chunks.
+DEFAULT_ROTATION_COUNTS: list[int] = [10**3, 10**4, 10**5, 10**6]
+DEFAULT_PRODUCT_ID_SPANS: list[int] = [10**3, 10**5, 10**7, 10**9, 10**12]
+
+# Day01 engines: name -> solver taking (start, compiled_rotations, lock_size).
+DAY01_ENGINES: dict[str, Callable[[int, day01.CompiledRotations, int], int]] = {
+    **{
+        method.name: (lambda start, rotations, lock_size, method=method: day01.calculate_password(start, rotations, lock_size, method))
+        for method in day01.Methods
+    },
+    'parallel_part1': lambda start, rotations, lock_size: day01.calculate_password_parallel(start, rotations, lock_size, day01.Methods.part1),
+    'parallel_part2': lambda start, rotations, lock_size: day01.calculate_password_parallel(start, rotations, lock_size, day01.Methods.part2),
+}
+
+# Day02 engines: name -> solver taking the range strings from read_input and the precomputed index.
+DAY02_ENGINES: dict[str, Callable[[list[str], day02.RepeatedTwiceIndex], int]] = {
+    'brute_force': lambda product_ids, index: day02.calculate_answer(day02.parse_product_ids(product_ids)),
+    **{
+        method.name: (
+            lambda product_ids, index, method=method: day02.calculate_answer_ranges(
+                map(day02.parse_product_id_range, product_ids), method, index=index
+            )
+        )
+        for method in day02.Methods
+    },
+    'parallel_part1': lambda product_ids, index: day02.calculate_answer_parallel(map(day02.parse_product_id_range, product_ids), day02.Methods.part1),
+    'parallel_part2': lambda product_ids, index: day02.calculate_answer_parallel(map(day02.parse_product_id_range, product_ids), day02.Methods.part2),
+}
+
+# Engines that are skipped when a workload is too big for them (see --max-clicks / --max-ids) or NumPy is missing.
+DAY01_TICKING_ENGINES: set[str] = {day01.Methods.part2.name}
+DAY01_NUMPY_ENGINES: set[str] = {day01.Methods.part1_vectorized.name, day01.Methods.part2_vectorized.name}
+DAY02_BRUTE_FORCE_ENGINES: set[str] = {
+    'brute_force',
+    'parallel_part1',
+    'parallel_part2',
+    day02.Methods.part1.name,
+    day02.Methods.part2.name,
+    day02.Methods.part1_vectorized.name,
+}
+DAY02_NUMPY_ENGINES: set[str] = {day02.Methods.part1_vectorized.name}
+
+
+def measure(solver: Callable[[], int], trace_memory: bool) -> dict[str, Any]:
+    """
+    Run a solver once for its wall time, then once more under tracemalloc for its peak memory.
+    :param solver: Function running the engine on a prepared workload.
+    :param trace_memory: Also measure the peak memory (doubles the run time).
+    :return: Dict with the answer, seconds and peak_bytes (None when not traced).
+    """
+    gc.collect()
+    start_time: float = time.perf_counter()
+    answer: int = solver()
+    seconds: float = time.perf_counter() - start_time
+
+    peak_bytes: int | None = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            solver()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {'answer': answer, 'seconds': seconds, 'peak_bytes': peak_bytes}
+
+
+def benchmark_day01(sizes: list[int], max_step: int, seed: int, max_clicks: int, trace_memory: bool) -> list[dict[str, Any]]:
+    """
+    Time every Day01 engine on seeded rotation logs of each size, written to a temporary file the parsers read back.
+    :param sizes: Numbers of rotations per log.
+    :param max_step: Largest rotation distance.
+    :param seed: Seed for the generators.
+    :param max_clicks: Skip the tick-by-tick engine when the log has more clicks than this.
+    :param trace_memory: Also measure the peak memory of each engine.
+    :return: List of result records.
+    """
+    results: list[dict[str, Any]] = []
+    numpy_available: bool = importlib.util.find_spec('numpy') is not None
+    if numpy_available:
+        # Import up front, so the first vectorized run is not charged for it.
+        import numpy  # noqa: F401
+
+    with tempfile.TemporaryDirectory() as input_directory:
+        input_file_name: str = os.path.join(input_directory, 'rotations.txt')
+
+        for size in sizes:
+            # The log is streamed to a file and parsed from it, so only the compiled rotations of each size are held in memory.
+            write_rotations(input_file_name, size, max_step, seed)
+            rotations: day01.CompiledRotations = day01.read_input_compiled(input_file_name)
+            click_count: int = sum(map(abs, rotations.rotation_steps))
+
+            # Parsers report the number of rotations parsed as their answer.
+            solvers: dict[str, Callable[[], int]] = {
+                'parse_line': lambda: len(day01.CompiledRotations.from_lines(day01.stream_input(input_file_name))),
+                'parse_input_bytes': lambda: len(day01.read_input_array(input_file_name)),
+            }
+            for name, engine in DAY01_ENGINES.items():
+                solvers[name] = lambda engine=engine: engine(50, rotations, 100)
+
+            for name, solver in solvers.items():
+                record: dict[str, Any] = {'day': 1, 'engine': name, 'size': size, 'max_step': max_step, 'seed': seed}
+
+                if name in DAY01_TICKING_ENGINES and click_count > max_clicks:
+                    record.update(status='skipped', reason=str(click_count) + ' clicks > --max-clicks')
+                elif name in DAY01_NUMPY_ENGINES and not numpy_available:
+                    record.update(status='skipped', reason='NumPy is not installed')
+                else:
+                    record.update(status='ok', **measure(solver, trace_memory))
+                    record['items_per_second'] = size / record['seconds'] if record['seconds'] > 0 else None
+
+                results.append(record)
+                print_record(record)
+
+            del rotations
+
+    return results
+
+
+def benchmark_day02(spans: list[int], range_count: int, max_digits: int, seed: int, max_ids: int, trace_memory: bool) -> list[dict[str, Any]]:
+    """
+    Time every Day02 engine on seeded product ID range files covering each span.
+    :param spans: Total number of IDs covered by each range file.
+    :param range_count: Number of ranges per file.
+    :param max_digits: Largest number of digits of an ID, also the digit limit of the index built for Methods.part1_index.
+    :param seed: Seed for the generators.
+    :param max_ids: Skip brute force engines when the file covers more IDs than this.
+    :param trace_memory: Also measure the peak memory of each engine.
+    :return: List of result records.
+    """
+    results: list[dict[str, Any]] = []
+    numpy_available: bool = importlib.util.find_spec('numpy') is not None
+    if numpy_available:
+        import numpy  # noqa: F401
+
+    with tempfile.TemporaryDirectory() as index_directory:
+        index_file_name: str = os.path.join(index_directory, 'repeated_twice.index')
+        day02.build_repeated_twice_index(index_file_name, max_digits)
+
+        with day02.RepeatedTwiceIndex(index_file_name) as index:
+            for span in spans:
+                product_ids: list[str] = format_product_id_ranges(generate_product_id_ranges(range_count, span, seed, max_digits)).split(',')
+
+                for name, engine in DAY02_ENGINES.items():
+                    record: dict[str, Any] = {'day': 2, 'engine': name, 'size': span, 'ranges': range_count, 'seed': seed}
+
+                    if name in DAY02_BRUTE_FORCE_ENGINES and span > max_ids:
+                        record.update(status='skipped', reason=str(span) + ' IDs > --max-ids')
+                    elif name in DAY02_NUMPY_ENGINES and not numpy_available:
+                        record.update(status='skipped', reason='NumPy is not installed')
+                    else:
+                        record.update(status='ok', **measure(lambda engine=engine: engine(product_ids, index), trace_memory))
+                        record['items_per_second'] = span / record['seconds'] if record['seconds'] > 0 else None
+
+                    results.append(record)
+                    print_record(record)
+
+    return results
+
+
+def print_record(record: dict[str, Any]) -> None:
+    """
+    Print a single result as a human-readable line.
+    :param record: A result record from benchmark_day01 / benchmark_day02.
+    """
+    label: str = 'Day{:02d} {:<20} {:>14,}'.format(record['day'], record['engine'], record['size'])
+
+    if record['status'] != 'ok':
+        print(label + '  skipped: ' + record['reason'])
+        return
+
+    peak: str = '' if record['peak_bytes'] is None else '  peak {:>8.1f} MiB'.format(record['peak_bytes'] / 2**20)
+    rate: str = '' if record['items_per_second'] is None else '  {:>14,.0f} items/s'.format(record['items_per_second'])
+    print(label + '  {:>10.4f} s'.format(record['seconds']) + rate + peak)
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark every engine of Day01 and Day02 on seeded synthetic inputs.')
+    parser.add_argument('--day', choices=['1', '2', 'all'], default='all')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_ROTATION_COUNTS, help='Day01 rotations per log (~50 bytes of memory each).')
+    parser.add_argument('--max-step', type=int, default=999, help='Day01 largest rotation distance.')
+    parser.add_argument('--max-clicks', type=int, default=10**8, help='Skip the Day01 tick engine above this many clicks.')
+    parser.add_argument('--spans', type=int, nargs='+', default=DEFAULT_PRODUCT_ID_SPANS, help='Day02 IDs covered per file (up to 10^12).')
+    parser.add_argument('--ranges', type=int, default=50, help='Day02 ranges per file.')
+    parser.add_argument('--max-digits', type=int, default=12, help='Day02 largest number of digits of an ID.')
+    parser.add_argument('--max-ids', type=int, default=10**7, help='Skip Day02 brute force engines above this many IDs.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass (peak memory is not reported).')
+    parser.add_argument('--output', default='benchmark_results.json', help='Machine-readable results file.')
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None) -> list[dict[str, Any]]:
+    options: argparse.Namespace = parse_arguments(arguments)
+    trace_memory: bool = not options.no_memory
+
+    results: list[dict[str, Any]] = []
+    if options.day in ('1', 'all'):
+        results.extend(benchmark_day01(options.sizes, options.max_step, options.seed, options.max_clicks, trace_memory))
+    if options.day in ('2', 'all'):
+        results.extend(benchmark_day02(options.spans, options.ranges, options.max_digits, options.seed, options.max_ids, trace_memory))
+
+    report: dict[str, Any] = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(options.output, 'w') as output_file:
+        json.dump(report, output_file, indent=2)
+    print('Results written to ' + options.output)
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
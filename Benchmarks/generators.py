@@ -0,0 +1,98 @@
+# Advent of Code 2025 - Benchmarks - Synthetic input generators
+# Done by: johanaxel007
+
+import random
+from array import array
+from collections.abc import Iterable, Iterator
+
+
+def iterate_rotation_steps(count: int, max_step: int = 999, seed: int = 0) -> Iterator[int]:
+    """
+    Generate a deterministic sequence of rotation steps for Day01, one at a time.
+    :param count: Number of rotations to generate.
+    :param max_step: Largest rotation distance (steps are 0..max_step in either direction).
+    :param seed: Seed for the random generator, the same seed always gives the same steps.
+    :return: Iterator of rotation steps. ex: -68, 48
+    """
+    generator: random.Random = random.Random(seed)
+    return (generator.randint(-max_step, max_step) for _ in range(count))
+
+
+def generate_rotation_steps(count: int, max_step: int = 999, seed: int = 0) -> array:
+    """
+    Generate a deterministic sequence of rotation steps for Day01.
+    :param count: Number of rotations to generate.
+    :param max_step: Largest rotation distance (steps are 0..max_step in either direction).
+    :param seed: Seed for the random generator, the same seed always gives the same steps.
+    :return: Signed 64-bit array of rotation steps. ex: array('q', [-68, 48])
+    """
+    return array('q', iterate_rotation_steps(count, max_step, seed))
+
+
+def format_rotations(rotation_steps: Iterable[int]) -> Iterator[str]:
+    """
+    Format rotation steps back into Day01 input lines.
+    :param rotation_steps: ex: [-68, 48]
+    :return: Iterator of rotation strings. ex: 'L68', 'R48'
+    """
+    for rotation_step in rotation_steps:
+        yield ('L' + str(-rotation_step)) if rotation_step < 0 else ('R' + str(rotation_step))
+
+
+def write_rotations(file_name: str, count: int, max_step: int = 999, seed: int = 0) -> None:
+    """
+    Write a deterministic Day01 input file, one rotation per line. The steps are streamed, so any count fits in memory.
+    :param file_name: ex: rotations.txt
+    :param count: Number of rotations to generate.
+    :param max_step: Largest rotation distance.
+    :param seed: Seed for the random generator.
+    """
+    with open(file_name, 'w') as output_file:
+        for line in format_rotations(iterate_rotation_steps(count, max_step, seed)):
+            output_file.write(line + '\n')
+
+
+def generate_product_id_ranges(count: int, total_span: int, seed: int = 0, max_digits: int = 18) -> list[tuple[int, int]]:
+    """
+    Generate deterministic Day02 product ID ranges, which together cover about total_span IDs.
+    :param count: Number of ranges to generate.
+    :param total_span: Total number of IDs covered by all ranges.
+    :param seed: Seed for the random generator, the same seed always gives the same ranges.
+    :param max_digits: Largest number of digits of an ID.
+    :return: List of (lower_bound, upper_bound) tuples, both inclusive.
+    """
+    generator: random.Random = random.Random(seed)
+
+    # Split the span into count random widths, so tiny and huge ranges are mixed.
+    cuts: list[int] = sorted(generator.randint(0, total_span) for _ in range(count - 1))
+    widths: list[int] = [upper - lower for lower, upper in zip([0] + cuts, cuts + [total_span])]
+
+    ranges: list[tuple[int, int]] = []
+    for width in widths:
+        width = max(width, 1)
+        lower_bound: int = generator.randint(1, max(1, 10**max_digits - width))
+        ranges.append((lower_bound, lower_bound + width - 1))
+
+    return ranges
+
+
+def format_product_id_ranges(ranges: Iterable[tuple[int, int]]) -> str:
+    """
+    Format product ID ranges into a Day02 input line.
+    :param ranges: ex: [(11, 22), (95, 115)]
+    :return: Comma separated ranges. ex: '11-22,95-115'
+    """
+    return ','.join(str(lower_bound) + '-' + str(upper_bound) for lower_bound, upper_bound in ranges)
+
+
+def write_product_id_ranges(file_name: str, count: int, total_span: int, seed: int = 0, max_digits: int = 18) -> None:
+    """
+    Write a deterministic Day02 input file, a single comma separated line of ranges.
+    :param file_name: ex: product_ids.txt
+    :param count: Number of ranges to generate.
+    :param total_span: Total number of IDs covered by all ranges.
+    :param seed: Seed for the random generator.
+    :param max_digits: Largest number of digits of an ID.
+    """
+    with open(file_name, 'w') as output_file:
+        output_file.write(format_product_id_ranges(generate_product_id_ranges(count, total_span, seed, max_digits)) + '\n')
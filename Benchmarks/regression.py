@@ -0,0 +1,236 @@
+# Advent of Code 2025 - Benchmarks - Performance regression gate
+# Done by: johanaxel007
+#
+# Run from the repository root:
+#   python -m Benchmarks.regression             Compare the hot paths against Benchmarks/baseline.json, exit 1 on a regression.
+#   python -m Benchmarks.regression --update    Refresh the baseline after an intended change, then commit it.
+#
+# Times are divided by the time of a fixed pure Python calibration loop, so a baseline taken on one machine still holds on a faster or slower one.
+
+import argparse
+import gc
+import importlib.util
+import json
+import math
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from itertools import chain
+from typing import Any
+
+import Day01.main_day01 as day01
+import Day02.main_day02 as day02
+from Benchmarks.generators import generate_product_id_ranges, generate_rotation_steps
+
+BASELINE_FILE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_TOLERANCE: float = 0.5
+DEFAULT_REPEATS: int = 7
+MIN_MEASURE_SECONDS: float = 0.02
+
+# Fixed workloads: about 10^6 clicks for Day01, 2 * 10^5 IDs for the Day02 brute force and 10^12 IDs for the Day02 arithmetic engines.
+DAY01_ROTATION_COUNT: int = 2_000
+DAY02_BRUTE_FORCE_SPAN: int = 200_000
+DAY02_ARITHMETIC_SPAN: int = 10**12
+WORKLOAD_SEED: int = 0
+
+
+def calibrate() -> int:
+    """
+    Fixed pure Python loop, timed to scale the workloads to the speed of the machine.
+    :return: A checksum, so the loop cannot be skipped.
+    """
+    total: int = 0
+    for value in range(300_000):
+        total += value * value % 7
+    return total
+
+
+def build_workloads() -> dict[str, Callable[[], int]]:
+    """
+    Build the seeded workloads of every hot path.
+    :return: Workload name -> function running it and returning its answer.
+    """
+    rotations: day01.CompiledRotations = day01.CompiledRotations(generate_rotation_steps(DAY01_ROTATION_COUNT, 999, WORKLOAD_SEED))
+    brute_force_ranges: list[range] = [
+        range(lower_bound, upper_bound + 1) for lower_bound, upper_bound in generate_product_id_ranges(20, DAY02_BRUTE_FORCE_SPAN, WORKLOAD_SEED, 10)
+    ]
+    arithmetic_ranges: list[range] = [
+        range(lower_bound, upper_bound + 1) for lower_bound, upper_bound in generate_product_id_ranges(50, DAY02_ARITHMETIC_SPAN, WORKLOAD_SEED, 14)
+    ]
+
+    workloads: dict[str, Callable[[], int]] = {}
+    for method in day01.Methods:
+        workloads['day01_calculate_password_' + method.name] = lambda method=method: day01.calculate_password(50, rotations, 100, method)
+    for method in (day02.Methods.part1, day02.Methods.part2):
+        workloads['day02_calculate_answer_' + method.name] = lambda method=method: day02.calculate_answer(chain.from_iterable(brute_force_ranges), method)
+    for method in (day02.Methods.part1_arithmetic, day02.Methods.part2_arithmetic, day02.Methods.digit_dp):
+        workloads['day02_calculate_answer_ranges_' + method.name] = lambda method=method: day02.calculate_answer_ranges(arithmetic_ranges, method)
+
+    return workloads
+
+
+# Workloads that need NumPy, skipped when it is not installed.
+NUMPY_WORKLOADS: set[str] = {
+    'day01_calculate_password_' + day01.Methods.part1_vectorized.name,
+    'day01_calculate_password_' + day01.Methods.part2_vectorized.name,
+}
+
+
+def time_calls(workload: Callable[[], int], number: int) -> tuple[int, float]:
+    """
+    Time a number of back to back runs of a workload.
+    :param workload: Function running the workload.
+    :param number: Number of runs.
+    :return: Tuple of (answer, seconds per run).
+    """
+    gc.collect()
+    start_time: float = time.perf_counter()
+    for _ in range(number):
+        answer: int = workload()
+    return answer, (time.perf_counter() - start_time) / number
+
+
+def best_relative_time(workload: Callable[[], int], repeats: int, min_seconds: float = MIN_MEASURE_SECONDS) -> tuple[int, float, float]:
+    """
+    Time a workload against the calibration loop, alternating the two so both see the same state of the machine, and keep the fastest runs.
+    Short workloads are run several times per measurement, so each measurement takes at least min_seconds.
+    :param workload: Function running the workload.
+    :param repeats: Number of measurements of each.
+    :param min_seconds: Shortest measurement.
+    :return: Tuple of (answer, seconds per run, seconds per calibration loop).
+    """
+    answer, first_seconds = time_calls(workload, 1)
+    number: int = max(1, math.ceil(min_seconds / first_seconds)) if first_seconds > 0 else 1000
+
+    seconds: list[float] = []
+    calibration_seconds: list[float] = []
+    for _ in range(repeats):
+        calibration_seconds.append(time_calls(calibrate, 1)[1])
+        answer, run_seconds = time_calls(workload, number)
+        seconds.append(run_seconds)
+
+    return answer, min(seconds), min(calibration_seconds)
+
+
+def run_workloads(repeats: int = DEFAULT_REPEATS, names: list[str] | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Time every workload.
+    :param repeats: Number of measurements per workload.
+    :param names: Only run these workloads.
+    :return: Workload name -> {'answer', 'seconds', 'relative'}, relative being the time in calibration loops.
+    """
+    numpy_available: bool = importlib.util.find_spec('numpy') is not None
+    if numpy_available:
+        # Import up front, so the first vectorized run is not charged for it.
+        import numpy  # noqa: F401
+
+    results: dict[str, dict[str, Any]] = {}
+    for name, workload in build_workloads().items():
+        if names is not None and name not in names:
+            continue
+        if name in NUMPY_WORKLOADS and not numpy_available:
+            continue
+
+        answer, seconds, calibration_seconds = best_relative_time(workload, repeats)
+        results[name] = {'answer': answer, 'seconds': seconds, 'relative': seconds / calibration_seconds}
+
+    return results
+
+
+def compare_results(baseline: dict[str, dict[str, Any]], results: dict[str, dict[str, Any]], tolerance: float) -> tuple[list[str], bool]:
+    """
+    Compare workload results against the baseline.
+    :param baseline: Workload name -> baseline result, from run_workloads.
+    :param results: Workload name -> current result, from run_workloads.
+    :param tolerance: Allowed slowdown, as a fraction of the baseline. ex: 0.5 fails anything more than 1.5x slower
+    :return: Tuple of (report lines, True if a workload regressed or changed its answer).
+    """
+    lines: list[str] = ['{:<46} {:>12} {:>12} {:>9}  {}'.format('Workload', 'Baseline', 'Current', 'Change', 'Status')]
+    failed: bool = False
+
+    for name in sorted(baseline.keys() | results.keys()):
+        if name not in results:
+            lines.append('{:<46} {:>12.4f} {:>12} {:>9}  {}'.format(name, baseline[name]['relative'], '-', '-', 'not run'))
+            continue
+        if name not in baseline:
+            lines.append('{:<46} {:>12} {:>12.4f} {:>9}  {}'.format(name, '-', results[name]['relative'], '-', 'new'))
+            continue
+
+        change: float = results[name]['relative'] / baseline[name]['relative'] - 1
+        if results[name]['answer'] != baseline[name]['answer']:
+            status: str = 'ANSWER CHANGED ({} -> {})'.format(baseline[name]['answer'], results[name]['answer'])
+            failed = True
+        elif change > tolerance:
+            status = 'REGRESSION (over +{:.0%})'.format(tolerance)
+            failed = True
+        else:
+            status = 'ok'
+
+        lines.append('{:<46} {:>12.4f} {:>12.4f} {:>+9.0%}  {}'.format(name, baseline[name]['relative'], results[name]['relative'], change, status))
+
+    return lines, failed
+
+
+def read_baseline(file_name: str) -> dict[str, Any]:
+    """
+    Read a baseline file.
+    :param file_name: ex: Benchmarks/baseline.json
+    :return: The baseline, with the results under 'workloads'.
+    """
+    with open(file_name, 'r') as baseline_file:
+        return json.load(baseline_file)
+
+
+def write_baseline(file_name: str, results: dict[str, dict[str, Any]], repeats: int) -> None:
+    """
+    Write results as the new baseline.
+    :param file_name: ex: Benchmarks/baseline.json
+    :param results: Workload name -> result, from run_workloads.
+    :param repeats: Number of runs per workload the results were taken with.
+    """
+    baseline: dict[str, Any] = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeats': repeats,
+        'workloads': results,
+    }
+    with open(file_name, 'w') as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+        baseline_file.write('\n')
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare the hot paths of Day01 and Day02 against a stored baseline.')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='Baseline file (default: Benchmarks/baseline.json).')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='Allowed slowdown as a fraction. ex: 0.5 for 50%%')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help='Measurements per workload, the fastest one is kept.')
+    parser.add_argument('--workloads', nargs='+', help='Only run these workloads.')
+    parser.add_argument('--update', action='store_true', help='Write the results as the new baseline instead of comparing.')
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None) -> int:
+    options: argparse.Namespace = parse_arguments(arguments)
+    results: dict[str, dict[str, Any]] = run_workloads(options.repeats, options.workloads)
+
+    if options.update:
+        write_baseline(options.baseline, results, options.repeats)
+        print('Baseline written to ' + options.baseline)
+        return 0
+
+    baseline: dict[str, dict[str, Any]] = read_baseline(options.baseline)['workloads']
+    if options.workloads is not None:
+        baseline = {name: result for name, result in baseline.items() if name in options.workloads}
+
+    lines, failed = compare_results(baseline, results, options.tolerance)
+    print('\n'.join(lines))
+    print('Times are in calibration loops ({:.4f} s on this machine).'.format(time_calls(calibrate, 1)[1]))
+    if failed:
+        print('Performance regression: refresh the baseline with --update only if the slowdown is intended.')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+import Benchmarks.generators as generators
+import Day01.main_day01 as day01
+import Day02.main_day02 as day02
+
+
+class TestGenerators(unittest.TestCase):
+    # --- Test: rotations ---
+    def test_generate_rotation_steps_is_seeded(self):
+        """The same seed should always give the same steps, within the max step."""
+        first = generators.generate_rotation_steps(500, max_step=50, seed=7)
+        second = generators.generate_rotation_steps(500, max_step=50, seed=7)
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 500)
+        self.assertTrue(all(-50 <= step <= 50 for step in first))
+
+    def test_format_rotations_round_trip(self):
+        """Formatted rotations should parse back to the same steps."""
+        steps = generators.generate_rotation_steps(200, seed=1)
+        lines = list(generators.format_rotations(steps))
+        self.assertEqual([day01.parse_line(line) for line in lines], steps.tolist())
+
+    def test_write_rotations_matches_generated_steps(self):
+        """A written file should hold the same steps as generate_rotation_steps for the same seed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'rotations.txt')
+            generators.write_rotations(file_name, 300, max_step=80, seed=4)
+            self.assertEqual(day01.read_input_array(file_name), generators.generate_rotation_steps(300, max_step=80, seed=4))
+
+    # --- Test: product ID ranges ---
+    def test_generate_product_id_ranges_span(self):
+        """Ranges should be valid and cover the requested span."""
+        ranges = generators.generate_product_id_ranges(20, 10**12, seed=3)
+        self.assertEqual(len(ranges), 20)
+        self.assertTrue(all(lower_bound <= upper_bound for lower_bound, upper_bound in ranges))
+        self.assertEqual(sum(upper_bound - lower_bound + 1 for lower_bound, upper_bound in ranges), 10**12)
+        self.assertEqual(ranges, generators.generate_product_id_ranges(20, 10**12, seed=3))
+
+    def test_format_product_id_ranges_round_trip(self):
+        """Formatted ranges should be accepted by parse_product_id."""
+        ranges = generators.generate_product_id_ranges(5, 100, seed=2, max_digits=4)
+        product_ids = generators.format_product_id_ranges(ranges).split(',')
+        for product_id, (lower_bound, upper_bound) in zip(product_ids, ranges):
+            self.assertEqual(day02.parse_product_id(product_id), list(range(lower_bound, upper_bound + 1)))
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
@@ -0,0 +1,59 @@
+import os
+import unittest
+import Benchmarks.regression as regression
+
+
+def result(answer: int, relative: float) -> dict:
+    return {'answer': answer, 'seconds': relative / 10, 'relative': relative}
+
+
+class TestRegression(unittest.TestCase):
+    # --- Test: compare_results ---
+    def test_compare_results_within_tolerance(self):
+        """Slowdowns within the tolerance, and any speedup, pass."""
+        lines, failed = regression.compare_results({'a': result(1, 1.0), 'b': result(2, 1.0)}, {'a': result(1, 1.4), 'b': result(2, 0.2)}, 0.5)
+        self.assertFalse(failed)
+        self.assertEqual(len(lines), 3)
+
+    def test_compare_results_regression(self):
+        """A 10x slower hot path fails, and is named in the report."""
+        lines, failed = regression.compare_results({'tick': result(1, 1.0)}, {'tick': result(1, 10.0)}, 0.5)
+        self.assertTrue(failed)
+        self.assertIn('tick', lines[1])
+        self.assertIn('REGRESSION', lines[1])
+        self.assertIn('+900%', lines[1])
+
+    def test_compare_results_answer_changed(self):
+        """A different answer fails, however fast it was found."""
+        lines, failed = regression.compare_results({'a': result(1, 1.0)}, {'a': result(2, 0.5)}, 0.5)
+        self.assertTrue(failed)
+        self.assertIn('ANSWER CHANGED (1 -> 2)', lines[1])
+
+    def test_compare_results_new_and_missing(self):
+        """Workloads only in the baseline or only in the results are reported, without failing."""
+        lines, failed = regression.compare_results({'old': result(1, 1.0)}, {'new': result(1, 1.0)}, 0.5)
+        self.assertFalse(failed)
+        self.assertIn('new', lines[1])
+        self.assertIn('not run', lines[2])
+
+    # --- Test: run_workloads ---
+    def test_run_workloads_answers_match_baseline(self):
+        """The fast workloads still give the answers stored in the committed baseline."""
+        baseline = regression.read_baseline(regression.BASELINE_FILE)['workloads']
+        names = [name for name, stored in baseline.items() if stored['relative'] < 1 and name not in regression.NUMPY_WORKLOADS]
+
+        results = regression.run_workloads(repeats=1, names=names)
+        self.assertEqual(sorted(results), sorted(names))
+        for name in names:
+            with self.subTest(workload=name):
+                self.assertEqual(results[name]['answer'], baseline[name]['answer'])
+
+    # --- Test: performance gate ---
+    @unittest.skipUnless(os.environ.get('AOC_PERF'), 'Set AOC_PERF=1 to compare the timings against the baseline')
+    def test_performance_gate(self):
+        """Every hot path is within the tolerance of the committed baseline."""
+        self.assertEqual(regression.main([]), 0)
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
@@ -0,0 +1,193 @@
+# Advent of Code 2025 - Common - Solve many input files at once
+# Done by: johanaxel007
+#
+# Run from the repository root:
+#   python -m Common.batch 1 inputs/ --workers 8 > results.jsonl
+#   python -m Common.batch 2 manifest.txt --part 1 --engine part1_arithmetic
+#
+# Every file is read and solved by a worker of a process pool, so reading a file overlaps with solving the others.
+# One JSON line is printed per file as soon as it is done, and a file that fails (even by killing its worker) only gives an error line.
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from Common.runner import DAY_MODULES, DAY_SOLVERS, load_day, select_method, select_parts
+
+MANIFEST_COMMENT: str = '#'
+
+
+def list_input_files(source: str) -> list[str]:
+    """
+    List the input files of a batch.
+    :param source: A directory (every file in it, hidden files and Day01 sidecars excepted) or a manifest (one path per line, relative to the manifest).
+    :return: Paths of the input files, in order.
+    """
+    if os.path.isdir(source):
+        return sorted(
+            entry.path
+            for entry in os.scandir(source)
+            if entry.is_file() and not entry.name.startswith('.') and not entry.name.endswith('.rotations')
+        )
+
+    manifest_directory: str = os.path.dirname(source)
+    with open(source, 'r') as manifest_file:
+        lines: list[str] = [line.strip() for line in manifest_file]
+
+    return [os.path.join(manifest_directory, line) for line in lines if line != '' and not line.startswith(MANIFEST_COMMENT)]
+
+
+def solve_file(position: int, input_file: str, options: argparse.Namespace) -> dict[str, Any]:
+    """
+    Read and solve a single input file, reporting any error instead of raising it.
+    :param position: Position of the file in the batch.
+    :param input_file: ex: inputs/team_01.txt
+    :param options: The parsed arguments (day, part, engine, start, lock_size, index).
+    :return: Result record, with status 'ok' and the answers, or status 'error' and the error.
+    """
+    record: dict[str, Any] = {'position': position, 'file': input_file, 'day': options.day}
+    start_time: float = time.perf_counter()
+
+    try:
+        module, _ = load_day(options.day)
+        read_day, prepare_solve = DAY_SOLVERS[options.day]
+        parts: list[int] = select_parts(module, options.day, options.part, options.engine)
+
+        day_input = read_day(module, input_file)
+        read_time: float = time.perf_counter()
+
+        answers: dict[str, int] = {}
+        for part in parts:
+            method = select_method(module, options.day, part, options.engine)
+            _, solve = prepare_solve(module, lambda: day_input, method, options)
+            answers[str(part)] = solve()
+
+        record.update(status='ok', answers=answers, read_seconds=read_time - start_time, solve_seconds=time.perf_counter() - read_time)
+    except Exception as error:
+        record.update(status='error', error=type(error).__name__ + ': ' + str(error))
+        if options.traceback:
+            record['traceback'] = traceback.format_exc()
+
+    record['seconds'] = time.perf_counter() - start_time
+    return record
+
+
+def error_record(position: int, input_file: str, options: argparse.Namespace, error: BaseException) -> dict[str, Any]:
+    """
+    Build the result record of a file whose worker failed, solve_file reporting every other error itself.
+    :param position: Position of the file in the batch.
+    :param input_file: ex: inputs/team_01.txt
+    :param options: The parsed arguments.
+    :param error: The error raised by the future of the file.
+    :return: Result record with status 'error'.
+    """
+    return {'position': position, 'file': input_file, 'day': options.day, 'status': 'error', 'error': type(error).__name__ + ': ' + str(error)}
+
+
+def solve_in_pool(
+    pending: deque[tuple[int, str]], workers: int, options: argparse.Namespace
+) -> Generator[dict[str, Any], None, tuple[list[tuple[int, str]], BrokenProcessPool | None]]:
+    """
+    Solve files across one process pool, with at most one file in flight per worker, until they are done or a worker dies.
+    :param pending: (position, input_file) of the files left, consumed as they are submitted.
+    :param workers: Number of worker processes.
+    :param options: The parsed arguments.
+    :return: Iterator of result records, returning (the files in flight, the error) when a worker died and broke the pool, else ([], None).
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: dict[Future, tuple[int, str]] = {}
+        while pending or futures:
+            while pending and len(futures) < workers:
+                position, input_file = pending.popleft()
+                futures[executor.submit(solve_file, position, input_file, options)] = (position, input_file)
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            broken: BrokenProcessPool | None = None
+            for future in done:
+                error: BaseException | None = future.exception()
+                if isinstance(error, BrokenProcessPool):
+                    broken = error
+                    continue
+                position, input_file = futures.pop(future)
+                yield future.result() if error is None else error_record(position, input_file, options, error)
+
+            # Every future left fails once the pool is broken, without telling which file killed the worker.
+            if broken is not None:
+                return list(futures.values()), broken
+
+    return [], None
+
+
+def solve_files(input_files: list[str], options: argparse.Namespace) -> Iterator[dict[str, Any]]:
+    """
+    Solve every input file across a process pool.
+    A worker dying (ex: killed for using too much memory) breaks the pool: the files in flight are then run again one per pool,
+    to find the one to blame, and the other files go on in a new pool.
+    :param input_files: Paths of the input files.
+    :param options: The parsed arguments, options.workers processes are used (1 runs in this process).
+    :return: Iterator of result records, in the order the files finish.
+    """
+    if options.workers == 1 or len(input_files) <= 1:
+        for position, input_file in enumerate(input_files):
+            yield solve_file(position, input_file, options)
+        return
+
+    pending: deque[tuple[int, str]] = deque(enumerate(input_files))
+    while pending:
+        in_flight, _ = yield from solve_in_pool(pending, options.workers, options)
+        for position, input_file in in_flight:
+            crashed, error = yield from solve_in_pool(deque([(position, input_file)]), 1, options)
+            if crashed:
+                yield error_record(position, input_file, options, error)
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Solve a day of Advent of Code 2025 for many input files, printing one JSON line per file.')
+    parser.add_argument('day', type=int, choices=sorted(DAY_MODULES))
+    parser.add_argument('source', help='Directory of input files, or manifest listing one input file per line.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Number of worker processes (default: one per CPU).')
+    parser.add_argument('--part', type=int, choices=[1, 2], nargs='+', help='Parts to solve (default: both, or the part answered by --engine).')
+    parser.add_argument('--engine', help='Name of a Methods member of the day (default: the fastest engine of each part).')
+    parser.add_argument('--start', type=int, default=50, help='Day01 starting point of the lock.')
+    parser.add_argument('--lock-size', type=int, default=100, help='Day01 size of the lock.')
+    parser.add_argument('--index', help='Day02 index file built by build_repeated_twice_index, for the part1_index engine.')
+    parser.add_argument('--traceback', action='store_true', help='Add the traceback of failed files to their JSON line.')
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None) -> int:
+    options: argparse.Namespace = parse_arguments(arguments)
+
+    # Check the engine once up front, rather than failing every file the same way.
+    module, _ = load_day(options.day)
+    for part in select_parts(module, options.day, options.part, options.engine):
+        select_method(module, options.day, part, options.engine)
+
+    input_files: list[str] = list_input_files(options.source)
+    start_time: float = time.perf_counter()
+    failed: int = 0
+
+    for record in solve_files(input_files, options):
+        failed += record['status'] != 'ok'
+        print(json.dumps(record), flush=True)
+
+    print(
+        'Solved {} of {} files in {:.3f} s'.format(len(input_files) - failed, len(input_files), time.perf_counter() - start_time),
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except (OSError, ValueError) as error:
+        sys.exit('Error: ' + str(error))
@@ -0,0 +1,205 @@
+# Advent of Code 2025 - Common - On-disk result cache
+# Done by: johanaxel007
+#
+# Answers are keyed by the content of the input, the day, part, engine and parameters, and the source of the solver,
+# so editing either the input or the solver gives a fresh key. Bypassed with the --no-cache flag or AOC_NO_CACHE=1.
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable
+from typing import Any
+
+CACHE_FLAG: str = '--no-cache'
+CACHE_BYPASS_ENVIRONMENT_VARIABLE: str = 'AOC_NO_CACHE'
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: str = 'AOC_CACHE_DIR'
+CACHE_SUFFIX: str = '.json'
+
+DEFAULT_CACHE_DIRECTORY: str = os.path.join(os.path.expanduser('~'), '.cache', 'aoc2025')
+DEFAULT_CACHE_MAX_BYTES: int = 1 << 20
+
+
+def hash_file(file_name: str) -> str:
+    """
+    Hash the content of a file, one block at a time.
+    :param file_name: ex: input.txt
+    :return: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_name, 'rb') as hashed_file:
+        while block := hashed_file.read(1 << 20):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of small JSON files, one per answer. The least recently used entries are evicted once the directory grows past max_bytes.
+    The cache is only a shortcut: an unusable directory or a bad entry is a cache miss, and a failed write only loses the entry, never the answer.
+    """
+
+    __slots__ = ('directory', 'max_bytes', 'code_version')
+
+    def __init__(self, code_file: str, directory: str | None = None, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory: str = directory or os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE) or DEFAULT_CACHE_DIRECTORY
+        self.max_bytes: int = max_bytes
+        self.code_version: str = hash_file(code_file)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError:
+            pass
+
+    def key(self, input_file: str, day: int, part: int, engine: str, parameters: dict[str, Any]) -> str:
+        """
+        Build the key of an answer.
+        :param input_file: ex: input.txt
+        :param day: ex: 1
+        :param part: ex: 2
+        :param engine: The method used. ex: Methods.part2_closed_form
+        :param parameters: Every other parameter the answer depends on. ex: {'start': 50, 'lock_size': 100}
+        :return: Hex SHA-256 digest.
+        """
+        description: str = json.dumps(
+            {
+                'input': hash_file(input_file),
+                'code': self.code_version,
+                'day': day,
+                'part': part,
+                'engine': str(engine),
+                'parameters': parameters,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def get(self, key: str) -> int | None:
+        """
+        Read an answer from the cache.
+        :param key: From ResultCache.key
+        :return: The answer, or None if it is not cached.
+        """
+        entry_name: str = os.path.join(self.directory, key + CACHE_SUFFIX)
+        try:
+            with open(entry_name, 'r') as entry_file:
+                entry: Any = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        # Anything but an integer answer (bool excepted) was not written by put, so it is treated as a miss.
+        answer: Any = entry.get('answer') if isinstance(entry, dict) else None
+        if type(answer) is not int:
+            return None
+
+        # Touch the entry, so eviction removes the least recently used ones first.
+        try:
+            os.utime(entry_name)
+        except OSError:
+            pass
+        return answer
+
+    def put(self, key: str, answer: int) -> None:
+        """
+        Store an answer in the cache, then evict old entries if the cache is too big.
+        :param key: From ResultCache.key
+        :param answer: The answer to store.
+        """
+        entry_name: str = os.path.join(self.directory, key + CACHE_SUFFIX)
+        temporary_name: str = entry_name + '.' + str(os.getpid())
+
+        try:
+            with open(temporary_name, 'w') as entry_file:
+                json.dump({'answer': answer}, entry_file)
+            os.replace(temporary_name, entry_name)
+        except OSError:
+            try:
+                os.remove(temporary_name)
+            except OSError:
+                pass
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in max_bytes.
+        """
+        entries: list[tuple[float, int, str]] = []
+        try:
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(CACHE_SUFFIX):
+                    continue
+                # Another run may remove an entry between listing and stat.
+                try:
+                    entry_stat: os.stat_result = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+        except OSError:
+            return
+
+        total_bytes: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_bytes -= size
+
+
+def cache_enabled(argv: list[str] | None = None) -> bool:
+    """
+    Find out if the cache should be used.
+    :param argv: Command line arguments (default: sys.argv).
+    :return: False when bypassed with --no-cache or AOC_NO_CACHE.
+    """
+    argv = sys.argv if argv is None else argv
+    bypass: str = os.environ.get(CACHE_BYPASS_ENVIRONMENT_VARIABLE, '').strip().lower()
+
+    return CACHE_FLAG not in argv and bypass in ('', '0', 'false', 'no', 'off')
+
+
+def open_result_cache(code_file: str, argv: list[str] | None = None) -> ResultCache | None:
+    """
+    Open the result cache for a solver module, unless it is bypassed.
+    :param code_file: The solver module, whose source is part of every key. ex: __file__
+    :param argv: Command line arguments (default: sys.argv).
+    :return: The cache, or None when bypassed.
+    """
+    return ResultCache(code_file) if cache_enabled(argv) else None
+
+
+def cached_answer(
+    cache: ResultCache | None,
+    input_file: str,
+    day: int,
+    part: int,
+    engine: str,
+    parameters: dict[str, Any],
+    solve: Callable[[], int],
+) -> int:
+    """
+    Return the cached answer, or solve and cache it.
+    :param cache: The cache, or None to always solve.
+    :param input_file: ex: input.txt
+    :param day: ex: 1
+    :param part: ex: 2
+    :param engine: The method used. ex: Methods.part2_closed_form
+    :param parameters: Every other parameter the answer depends on. ex: {'start': 50, 'lock_size': 100}
+    :param solve: Computes the answer on a cache miss.
+    :return: The answer.
+    """
+    if cache is None:
+        return solve()
+
+    key: str = cache.key(input_file, day, part, engine, parameters)
+    answer: int | None = cache.get(key)
+
+    if answer is None:
+        answer = solve()
+        cache.put(key, answer)
+
+    return answer
@@ -0,0 +1,216 @@
+# Advent of Code 2025 - Common - Opt-in per stage memory profiling
+# Done by: johanaxel007
+#
+# Enabled with the --memory flag or the AOC_MEMORY environment variable (AOC_MEMORY=1 reports to stderr, AOC_MEMORY=report.json to a file).
+# Uses tracemalloc, so the instrumented functions run a few times slower: do not combine with --timing for exact times.
+# tracemalloc is only imported once profiling is enabled, so memory_output is cheap to call on every run.
+
+import atexit
+import functools
+import json
+import os
+import sys
+from collections.abc import Callable
+from typing import Any
+
+MEMORY_FLAG: str = '--memory'
+MEMORY_ENVIRONMENT_VARIABLE: str = 'AOC_MEMORY'
+MEMORY_TOP_SITES: int = 5
+
+
+class MemoryStats:
+    """
+    Peak and net allocation of one instrumented function (or of one whole stage), with the sites that allocated the most.
+    Net is what is still allocated after the call returns (ex: its result). Peak is the most allocated at once during the call, above what was allocated
+    before it, and traced_peak_bytes the most allocated at once by the whole process during the call.
+    """
+
+    __slots__ = ('stage', 'calls', 'peak_bytes', 'net_bytes', 'traced_peak_bytes', 'top_sites')
+
+    def __init__(self, stage: str):
+        self.stage: str = stage
+        self.calls: int = 0
+        self.peak_bytes: int = 0
+        self.net_bytes: int = 0
+        self.traced_peak_bytes: int = 0
+        self.top_sites: list[dict[str, Any]] = []
+
+    def add_call(self, start_bytes: int, peak_bytes: int, end_bytes: int) -> None:
+        self.calls += 1
+        self.peak_bytes = max(self.peak_bytes, peak_bytes - start_bytes)
+        self.net_bytes += end_bytes - start_bytes
+        self.traced_peak_bytes = max(self.traced_peak_bytes, peak_bytes)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'stage': self.stage,
+            'calls': self.calls,
+            'peak_bytes': self.peak_bytes,
+            'net_bytes': self.net_bytes,
+            'traced_peak_bytes': self.traced_peak_bytes,
+            'top_sites': self.top_sites,
+        }
+
+
+# Function name -> stats, and stage -> stats counting only the outermost call of each stage, filled in by the wrappers of instrument_memory.
+MEMORY_STATS: dict[str, MemoryStats] = {}
+STAGE_MEMORY_STATS: dict[str, MemoryStats] = {}
+
+# One frame per instrumented call in progress: [stage, allocated when the call started, highest peak of the calls it made].
+CALL_STACK: list[list] = []
+
+
+def top_sites(before: 'tracemalloc.Snapshot', after: 'tracemalloc.Snapshot', limit: int = MEMORY_TOP_SITES) -> list[dict[str, Any]]:
+    """
+    Find the source lines whose allocations grew the most between two snapshots.
+    :param before: Snapshot taken when the call started.
+    :param after: Snapshot taken when the call returned.
+    :param limit: Number of sites to keep.
+    :return: List of {'site': 'file:line', 'size_bytes': ..., 'count': ...}, biggest first.
+    """
+    import tracemalloc
+
+    # Allocations made by the profiler itself are not reported. Compared by name, as tracemalloc.Filter allocates while matching.
+    profiler_files: tuple[str, str] = (tracemalloc.__file__, __file__)
+
+    sites: list[dict[str, Any]] = []
+    # Sorted by absolute difference, so freed sites are skipped rather than ending the search.
+    for difference in after.compare_to(before, 'lineno'):
+        frame: tracemalloc.Frame = difference.traceback[0]
+        if len(sites) == limit:
+            break
+        if difference.size_diff <= 0 or frame.filename in profiler_files:
+            continue
+        sites.append({'site': frame.filename + ':' + str(frame.lineno), 'size_bytes': difference.size_diff, 'count': difference.count_diff})
+
+    return sites
+
+
+def traced(stage: str, name: str, function: Callable) -> Callable:
+    """
+    Wrap a function so every call adds to its MemoryStats. Nested calls each get their own peak.
+    The first call that is not nested in another call of the same stage also records the top allocation sites (snapshots are too slow for every call).
+    :param stage: The stage the function belongs to. ex: 'parse'
+    :param name: The name to report the function under.
+    :param function: The function to wrap.
+    :return: The wrapped function.
+    """
+    import tracemalloc
+
+    stats: MemoryStats = MEMORY_STATS.setdefault(name, MemoryStats(stage))
+    stage_stats: MemoryStats = STAGE_MEMORY_STATS.setdefault(stage, MemoryStats(stage))
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not tracemalloc.is_tracing():
+            return function(*args, **kwargs)
+
+        outermost_of_stage: bool = all(frame[0] != stage for frame in CALL_STACK)
+        before: tracemalloc.Snapshot | None = tracemalloc.take_snapshot() if outermost_of_stage and stats.calls == 0 else None
+
+        # Keep the peak reached so far by the caller, as the peak is reset for this call.
+        allocated_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        if CALL_STACK:
+            CALL_STACK[-1][2] = max(CALL_STACK[-1][2], peak_bytes)
+        tracemalloc.reset_peak()
+        CALL_STACK.append([stage, allocated_bytes, 0])
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _, start_bytes, child_peak_bytes = CALL_STACK.pop()
+            end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            peak_bytes = max(peak_bytes, child_peak_bytes)
+            if CALL_STACK:
+                CALL_STACK[-1][2] = max(CALL_STACK[-1][2], peak_bytes)
+
+            stats.add_call(start_bytes, peak_bytes, end_bytes)
+            if outermost_of_stage:
+                stage_stats.add_call(start_bytes, peak_bytes, end_bytes)
+            if before is not None:
+                stats.top_sites = top_sites(before, tracemalloc.take_snapshot())
+                stage_stats.top_sites = stage_stats.top_sites or stats.top_sites
+                # The snapshots are freed by now, so they are not counted in the peak of the caller.
+                del before
+                tracemalloc.reset_peak()
+
+    return wrapper
+
+
+def instrument_memory(namespace: dict[str, Any], stages: dict[str, list[str]]) -> None:
+    """
+    Replace the functions of a module namespace with traced wrappers. Callers inside the module pick them up through the global lookup.
+    :param namespace: The module globals. ex: globals()
+    :param stages: Stage -> names of the functions in that stage. ex: {'parse': ['parse_line']}
+    """
+    for stage, names in stages.items():
+        for name in names:
+            namespace[name] = traced(stage, name, namespace[name])
+
+
+def memory_output(argv: list[str] | None = None) -> str | None:
+    """
+    Find out if memory profiling was requested, and where the report goes.
+    :param argv: Command line arguments (default: sys.argv).
+    :return: '-' for stderr or the path of a JSON file, or None when profiling is disabled.
+    """
+    argv = sys.argv if argv is None else argv
+    requested: str = os.environ.get(MEMORY_ENVIRONMENT_VARIABLE, '').strip()
+
+    if requested.lower().endswith('.json'):
+        return requested
+    if MEMORY_FLAG in argv or requested.lower() not in ('', '0', 'false', 'no', 'off'):
+        return '-'
+    return None
+
+
+def format_report() -> str:
+    """
+    Format the collected stats as JSON. Function stats include the nested calls they make, stage stats only count each stage once.
+    :return: The report.
+    """
+    return json.dumps(
+        {
+            'stages': {stage: stats.as_dict() for stage, stats in STAGE_MEMORY_STATS.items()},
+            'functions': {name: stats.as_dict() for name, stats in MEMORY_STATS.items()},
+            'traced_peak_bytes': max([0, *(stats.traced_peak_bytes for stats in STAGE_MEMORY_STATS.values())]),
+        },
+        indent=2,
+    )
+
+
+def write_report(output: str) -> None:
+    """
+    Write the report and stop tracing.
+    :param output: '-' for stderr, or the path of a JSON file.
+    """
+    import tracemalloc
+
+    report: str = format_report()
+    tracemalloc.stop()
+
+    if output == '-':
+        print(report, file=sys.stderr)
+    else:
+        with open(output, 'w') as report_file:
+            report_file.write(report + '\n')
+
+
+def enable_memory_profiling(namespace: dict[str, Any], stages: dict[str, list[str]], argv: list[str] | None = None) -> bool:
+    """
+    Start tracemalloc, instrument the given stages and write a report at exit, if profiling was requested.
+    :param namespace: The module globals. ex: globals()
+    :param stages: Stage -> names of the functions in that stage.
+    :param argv: Command line arguments (default: sys.argv).
+    :return: True if profiling is enabled.
+    """
+    output: str | None = memory_output(argv)
+    if output is None:
+        return False
+
+    import tracemalloc
+
+    instrument_memory(namespace, stages)
+    tracemalloc.start()
+    atexit.register(write_report, output)
+    return True
@@ -0,0 +1,248 @@
+# Advent of Code 2025 - Common - Single entry point for every day
+# Done by: johanaxel007
+#
+# Run from the repository root:
+#   python -m Common.runner 1 --part 2 --engine part2_closed_form --input Day01/input.txt --start 50 --lock-size 100
+#
+# Only the requested day module is imported, and only once the arguments are parsed, so adding days does not slow down the start.
+# With --timing (or AOC_TIMING) the startup, import and per part times are added to the stage report of the day on stderr.
+# With --memory (or AOC_MEMORY) the peak and net memory of each stage are reported as JSON, use --no-cache so the stages actually run.
+
+import time
+
+# CPU time (not wall time, unlike the other rows of the report) spent before this module ran: interpreter startup and the imports of the command.
+STARTUP_CPU_SECONDS: float = time.process_time()
+
+import argparse
+import functools
+import importlib
+import os
+import sys
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+from Common.cache import ResultCache, cache_enabled, cached_answer
+from Common.memory import enable_memory_profiling, memory_output
+from Common.timing import STAGE_STATS, StageStats, enable_stage_timing, timing_format
+
+REPOSITORY_DIRECTORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Day -> module solving it, imported on demand.
+DAY_MODULES: dict[int, str] = {
+    1: 'Day01.main_day01',
+    2: 'Day02.main_day02',
+}
+
+# (Day, part) -> name of the Methods member used when no engine is given.
+DEFAULT_ENGINES: dict[tuple[int, int], str] = {
+    (1, 1): 'part1',
+    (1, 2): 'part2_closed_form',
+    (2, 1): 'part1_arithmetic',
+    (2, 2): 'part2_arithmetic',
+}
+
+
+def load_day(day: int) -> tuple[ModuleType, float]:
+    """
+    Import the module of a day.
+    :param day: ex: 1
+    :return: Tuple of (module, seconds spent importing it).
+    """
+    if day not in DAY_MODULES:
+        raise ValueError('Invalid day: ' + str(day) + ' - Known days: ' + ', '.join(map(str, DAY_MODULES)))
+
+    start_time: float = time.perf_counter()
+    module: ModuleType = importlib.import_module(DAY_MODULES[day])
+    return module, time.perf_counter() - start_time
+
+
+def default_input_file(day: int) -> str:
+    """
+    Find the input file of a day in the repository. ex: Day01/input.txt
+    :param day: ex: 1
+    :return: Path of the input file.
+    """
+    return os.path.join(REPOSITORY_DIRECTORY, 'Day{:02d}'.format(day), 'input.txt')
+
+
+def engine_part(module: ModuleType, day: int, method) -> int:
+    """
+    Find the part a method of a day answers.
+    :param module: The day module.
+    :param day: ex: 1
+    :param method: A Methods member of the day.
+    :return: 1 or 2
+    """
+    part2_methods: frozenset = module.PASSING_METHODS if day == 1 else module.PART2_METHODS
+    return 2 if method in part2_methods else 1
+
+
+def select_method(module: ModuleType, day: int, part: int | None, engine: str | None):
+    """
+    Find the Methods member of a day for an engine name, and check it answers the requested part.
+    :param module: The day module.
+    :param day: ex: 1
+    :param part: 1 or 2, or None to accept an engine of either part.
+    :param engine: Name of a Methods member, or None for the default engine of the part. ex: 'part2_closed_form'
+    :return: The Methods member.
+    """
+    engine = engine or DEFAULT_ENGINES[(day, part)]
+    if engine not in module.Methods.__members__:
+        raise ValueError('Invalid engine: ' + engine + ' - Day ' + str(day) + ' engines: ' + ', '.join(module.Methods.__members__))
+
+    method = module.Methods[engine]
+    if part is not None and engine_part(module, day, method) != part:
+        raise ValueError('Invalid engine: ' + engine + ' - Does not answer Part ' + str(part) + ' of day ' + str(day))
+
+    return method
+
+
+def select_parts(module: ModuleType, day: int, parts: list[int] | None, engine: str | None) -> list[int]:
+    """
+    Find the parts to solve: the requested ones, else the part answered by the engine, else both.
+    :param module: The day module.
+    :param day: ex: 1
+    :param parts: The requested parts, or None.
+    :param engine: Name of a Methods member, or None.
+    :return: ex: [1, 2]
+    """
+    if parts:
+        return parts
+    if engine is not None:
+        return [engine_part(module, day, select_method(module, day, None, engine))]
+    return [1, 2]
+
+
+def is_streamed_input(input_file: str | None) -> bool:
+    """
+    Find out if a Day01 input is read with the streaming reader: stdin and gzip inputs, which can be too big to hold in memory.
+    :param input_file: ex: '-', input.txt.gz
+    :return: True for stdin and gzip inputs.
+    """
+    return input_file is not None and (input_file == '-' or input_file.endswith('.gz'))
+
+
+def read_day01(module: ModuleType, input_file: str):
+    """
+    Read a Day01 input into compiled rotations. Stdin and gzip inputs go through the streaming reader.
+    :return: The compiled rotations.
+    """
+    if is_streamed_input(input_file):
+        return module.CompiledRotations.from_lines(module.stream_input(input_file))
+    return module.read_input_compiled(input_file)
+
+
+def solve_day01(module: ModuleType, load: Callable, method, options: argparse.Namespace) -> tuple[dict[str, Any], Callable[[], int]]:
+    """
+    Prepare a Day01 solve.
+    :param module: The day module.
+    :param load: Returns the input read by read_day01, read once for every part.
+    :param method: The Methods member.
+    :param options: The parsed arguments.
+    :return: Tuple of (the parameters the answer depends on, function computing the answer).
+    """
+    parameters: dict[str, Any] = {'start': options.start, 'lock_size': options.lock_size}
+
+    # A single loop-based part reads a streamed input once, so the lines go straight to the solver in constant memory.
+    input_file: str | None = getattr(options, 'input', None)
+    if is_streamed_input(input_file) and method not in module.VECTORIZED_METHODS and len(select_parts(module, 1, options.part, options.engine)) == 1:
+        return parameters, lambda: module.calculate_password(options.start, module.stream_input(input_file), options.lock_size, method)
+
+    return parameters, lambda: module.calculate_password(options.start, load(), options.lock_size, method)
+
+
+def solve_day02(module: ModuleType, load: Callable, method, options: argparse.Namespace) -> tuple[dict[str, Any], Callable[[], int]]:
+    """
+    Prepare a Day02 solve. Methods.part1_index reads the index given with --index.
+    :param module: The day module.
+    :param load: Returns the ranges read by read_input_ranges, read once for every part.
+    :param method: The Methods member.
+    :param options: The parsed arguments.
+    :return: Tuple of (the parameters the answer depends on, function computing the answer).
+    """
+
+    def solve() -> int:
+        if options.index is None:
+            return module.calculate_answer_ranges(load(), method)
+        with module.RepeatedTwiceIndex(options.index) as index:
+            return module.calculate_answer_ranges(load(), method, index=index)
+
+    return {}, solve
+
+
+# Day -> (function reading its input, function preparing its solve from the parsed arguments).
+DAY_SOLVERS: dict[int, tuple[Callable, Callable]] = {
+    1: (read_day01, solve_day01),
+    2: (lambda module, input_file: module.read_input_ranges(input_file), solve_day02),
+}
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """
+    Add a runner step to the stage report of Common.timing.
+    :param name: ex: 'import'
+    :param seconds: Time spent in the step.
+    """
+    stats: StageStats = STAGE_STATS.setdefault(name, StageStats('runner'))
+    stats.calls += 1
+    stats.seconds += seconds
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Solve a day of Advent of Code 2025.')
+    parser.add_argument('day', type=int, choices=sorted(DAY_MODULES))
+    parser.add_argument('--part', type=int, choices=[1, 2], nargs='+', help='Parts to solve (default: both, or the part answered by --engine).')
+    parser.add_argument('--engine', help='Name of a Methods member of the day (default: the fastest engine of each part).')
+    parser.add_argument('--input', help="Input file, '-' for stdin on Day01 (default: DayNN/input.txt).")
+    parser.add_argument('--start', type=int, default=50, help='Day01 starting point of the lock.')
+    parser.add_argument('--lock-size', type=int, default=100, help='Day01 size of the lock.')
+    parser.add_argument('--index', help='Day02 index file built by build_repeated_twice_index, for the part1_index engine.')
+    parser.add_argument('--timing', action='store_true', help='Report startup, import and stage times to stderr (see also AOC_TIMING).')
+    parser.add_argument('--memory', action='store_true', help='Report the peak and net memory of each stage as JSON to stderr (see also AOC_MEMORY).')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the result cache (see also AOC_NO_CACHE).')
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str] | None = None) -> dict[int, int]:
+    arguments = sys.argv[1:] if arguments is None else arguments
+    options: argparse.Namespace = parse_arguments(arguments)
+    output_format: str | None = timing_format(arguments)
+
+    module, import_seconds = load_day(options.day)
+    if output_format is not None:
+        record_timing('startup (CPU time)', STARTUP_CPU_SECONDS)
+        record_timing('import ' + DAY_MODULES[options.day], import_seconds)
+        enable_stage_timing(vars(module), module.TIMING_STAGES, arguments)
+    # tracemalloc is only imported when profiling is requested.
+    if memory_output(arguments) is not None:
+        enable_memory_profiling(vars(module), module.TIMING_STAGES, arguments)
+
+    input_file: str = options.input or default_input_file(options.day)
+    result_cache: ResultCache | None = ResultCache(module.__file__) if cache_enabled(arguments) and input_file != '-' else None
+
+    parts: list[int] = select_parts(module, options.day, options.part, options.engine)
+
+    # Only read when an answer is not cached, and only once for both parts.
+    read_day, prepare_solve = DAY_SOLVERS[options.day]
+    load: Callable = functools.cache(lambda: read_day(module, input_file))
+
+    answers: dict[int, int] = {}
+    for part in parts:
+        method = select_method(module, options.day, part, options.engine)
+        parameters, solve = prepare_solve(module, load, method, options)
+
+        start_time: float = time.perf_counter()
+        answers[part] = cached_answer(result_cache, input_file, options.day, part, method, parameters, solve)
+        record_timing('part ' + str(part), time.perf_counter() - start_time)
+
+        print(f'PW Part {part}: {answers[part]}')
+
+    return answers
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except (OSError, ValueError) as error:
+        sys.exit('Error: ' + str(error))
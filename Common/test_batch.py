@@ -0,0 +1,99 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+import unittest.mock
+import Common.batch as batch
+import Common.runner as runner
+
+ROTATIONS: str = 'L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n'
+
+
+def read_or_crash(module, input_file: str):
+    """Reader killing its worker process on a file named crash, like the OOM killer would."""
+    if os.path.basename(input_file).startswith('crash'):
+        os._exit(1)
+    return runner.read_day01(module, input_file)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.input_files = [self.write('team_' + str(team) + '.txt', ROTATIONS) for team in range(3)]
+        self.bad_file = self.write('team_bad.txt', 'L68\nX30\n')
+
+    def write(self, name: str, content: str) -> str:
+        file_name = os.path.join(self.tmp_dir.name, name)
+        with open(file_name, 'w') as input_file:
+            input_file.write(content)
+        return file_name
+
+    def run_main(self, arguments: list[str]) -> tuple[int, list[dict]]:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            exit_code = batch.main(arguments)
+        return exit_code, [json.loads(line) for line in output.getvalue().splitlines()]
+
+    # --- Test: list_input_files ---
+    def test_list_input_files(self):
+        """A directory lists its files in order, a manifest lists its lines relative to itself."""
+        self.write('.hidden', '')
+        self.write('team_0.txt.rotations', '')
+        self.assertEqual(batch.list_input_files(self.tmp_dir.name), [*self.input_files, self.bad_file])
+
+        manifest = self.write('manifest.txt', '# Teams\nteam_2.txt\n\n team_0.txt \n')
+        self.assertEqual(batch.list_input_files(manifest), [self.input_files[2], self.input_files[0]])
+
+    # --- Test: main ---
+    def test_main_isolates_errors(self):
+        """A bad file gives an error line, every other file is still solved."""
+        for workers in ('1', '2'):
+            with self.subTest(workers=workers):
+                exit_code, records = self.run_main(['1', self.tmp_dir.name, '--workers', workers])
+                records.sort(key=lambda record: record['position'])
+
+                self.assertEqual(exit_code, 1)
+                self.assertEqual([record['status'] for record in records], ['ok', 'ok', 'ok', 'error'])
+                self.assertEqual([record['answers'] for record in records[:3]], [{'1': 3, '2': 6}] * 3)
+                self.assertIn('ValueError', records[3]['error'])
+                self.assertTrue(all(record['solve_seconds'] >= 0 for record in records[:3]))
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork', 'Workers must inherit the patched reader')
+    def test_main_worker_died(self):
+        """A worker dying only gives an error line for its own file, every other file is still solved."""
+        self.write('crash.txt', ROTATIONS)
+        good_files = self.input_files + [self.write('zteam_' + str(team) + '.txt', ROTATIONS) for team in range(20)]
+        with unittest.mock.patch.dict(runner.DAY_SOLVERS, {1: (read_or_crash, runner.solve_day01)}):
+            exit_code, records = self.run_main(['1', self.tmp_dir.name, '--workers', '4'])
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(sorted(record['position'] for record in records), list(range(len(good_files) + 2)))
+        records_by_file = {record['file']: record for record in records}
+        self.assertEqual(records_by_file[os.path.join(self.tmp_dir.name, 'crash.txt')]['status'], 'error')
+        self.assertIn('BrokenProcessPool', records_by_file[os.path.join(self.tmp_dir.name, 'crash.txt')]['error'])
+        self.assertEqual(records_by_file[self.bad_file]['status'], 'error')
+        for input_file in good_files:
+            self.assertEqual(records_by_file[input_file]['status'], 'ok', input_file)
+            self.assertEqual(records_by_file[input_file]['answers'], {'1': 3, '2': 6})
+
+    def test_main_engine(self):
+        """The engine picks the part, and every file succeeds."""
+        manifest = self.write('manifest.txt', '\n'.join(os.path.basename(input_file) for input_file in self.input_files))
+        exit_code, records = self.run_main(['1', manifest, '--engine', 'part2', '--workers', '1'])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([record['answers'] for record in records], [{'2': 6}] * 3)
+
+    def test_main_invalid_engine(self):
+        """An unknown engine fails before any file is read."""
+        with self.assertRaises(ValueError):
+            self.run_main(['1', self.tmp_dir.name, '--engine', 'part3'])
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
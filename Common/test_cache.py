@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+import Common.cache as cache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.input_file = self.write('input.txt', 'L68\nR48\n')
+        self.code_file = self.write('main_day01.py', 'def solve(): ...\n')
+        self.cache_directory = os.path.join(self.tmp_dir.name, 'cache')
+
+    def write(self, name: str, content: str) -> str:
+        file_name = os.path.join(self.tmp_dir.name, name)
+        with open(file_name, 'w') as output_file:
+            output_file.write(content)
+        return file_name
+
+    def solve_counting(self, answer: int) -> tuple[list[int], callable]:
+        calls: list[int] = []
+
+        def solve() -> int:
+            calls.append(answer)
+            return answer
+
+        return calls, solve
+
+    # --- Test: cached_answer ---
+    def test_cached_answer_hit(self):
+        """The second run returns the stored answer without solving."""
+        result_cache = cache.ResultCache(self.code_file, self.cache_directory)
+        calls, solve = self.solve_counting(1066)
+
+        for _ in range(2):
+            answer = cache.cached_answer(result_cache, self.input_file, 1, 1, 'part1', {'start': 50, 'lock_size': 100}, solve)
+            self.assertEqual(answer, 1066)
+        self.assertEqual(len(calls), 1)
+
+    def test_cached_answer_key_changes(self):
+        """Input content, parameters and solver code all change the key."""
+        result_cache = cache.ResultCache(self.code_file, self.cache_directory)
+        key = result_cache.key(self.input_file, 1, 1, 'part1', {'start': 50})
+
+        self.assertNotEqual(key, result_cache.key(self.input_file, 1, 1, 'part1', {'start': 51}))
+        self.assertNotEqual(key, result_cache.key(self.input_file, 1, 2, 'part1', {'start': 50}))
+        self.assertNotEqual(key, result_cache.key(self.input_file, 1, 1, 'part2', {'start': 50}))
+
+        self.write('input.txt', 'L68\nR49\n')
+        self.assertNotEqual(key, result_cache.key(self.input_file, 1, 1, 'part1', {'start': 50}))
+
+        self.write('input.txt', 'L68\nR48\n')
+        self.write('main_day01.py', 'def solve(): return 1\n')
+        new_code_cache = cache.ResultCache(self.code_file, self.cache_directory)
+        self.assertNotEqual(key, new_code_cache.key(self.input_file, 1, 1, 'part1', {'start': 50}))
+
+    def test_cached_answer_bypass(self):
+        """Without a cache the answer is always solved."""
+        calls, solve = self.solve_counting(6223)
+        for _ in range(2):
+            self.assertEqual(cache.cached_answer(None, self.input_file, 1, 2, 'part2', {}, solve), 6223)
+        self.assertEqual(len(calls), 2)
+
+    def test_cache_enabled(self):
+        """The flag and the environment variable both bypass the cache."""
+        with unittest.mock.patch.dict('os.environ', {}, clear=True):
+            self.assertTrue(cache.cache_enabled(['main_day01.py']))
+            self.assertFalse(cache.cache_enabled(['main_day01.py', '--no-cache']))
+        with unittest.mock.patch.dict('os.environ', {'AOC_NO_CACHE': '1'}):
+            self.assertFalse(cache.cache_enabled(['main_day01.py']))
+
+    def test_cached_answer_unusable_directory(self):
+        """A cache directory that cannot be created or written to falls back to solving."""
+        result_cache = cache.ResultCache(self.code_file, self.input_file)
+        calls, solve = self.solve_counting(1066)
+
+        for _ in range(2):
+            self.assertEqual(cache.cached_answer(result_cache, self.input_file, 1, 1, 'part1', {}, solve), 1066)
+        self.assertEqual(len(calls), 2)
+
+    def test_put_write_fails(self):
+        """A failed write keeps the answer and leaves no temporary file behind."""
+        result_cache = cache.ResultCache(self.code_file, self.cache_directory)
+        calls, solve = self.solve_counting(6223)
+
+        with unittest.mock.patch('os.replace', side_effect=OSError('disk full')):
+            self.assertEqual(cache.cached_answer(result_cache, self.input_file, 1, 2, 'part2', {}, solve), 6223)
+        self.assertEqual(os.listdir(self.cache_directory), [])
+
+    # --- Test: get ---
+    def test_get_invalid_entry(self):
+        """An entry without an integer answer is a cache miss."""
+        result_cache = cache.ResultCache(self.code_file, self.cache_directory)
+        key = result_cache.key(self.input_file, 1, 1, 'part1', {})
+        entry_name = os.path.join(self.cache_directory, key + cache.CACHE_SUFFIX)
+
+        entries = [('[1]', None), ('{"answer": "abc"}', None), ('{"answer": true}', None), ('{"answer": 5.0}', None), ('{"answer": 7}', 7)]
+        for content, expected in entries:
+            with self.subTest(content=content):
+                with open(entry_name, 'w') as entry_file:
+                    entry_file.write(content)
+                self.assertEqual(result_cache.get(key), expected)
+
+    # --- Test: evict ---
+    def test_evict_entry_removed_by_another_run(self):
+        """An entry removed between listing and stat is skipped."""
+        result_cache = cache.ResultCache(self.code_file, self.cache_directory, max_bytes=0)
+        removed_entry = unittest.mock.Mock(path=os.path.join(self.cache_directory, 'removed.json'))
+        removed_entry.name = 'removed.json'
+        removed_entry.stat.side_effect = FileNotFoundError
+
+        with unittest.mock.patch('os.scandir', return_value=[removed_entry]):
+            result_cache.evict()
+        with unittest.mock.patch('os.scandir', side_effect=PermissionError):
+            result_cache.evict()
+
+    # --- Test: evict ---
+    def test_evict_least_recently_used(self):
+        """Once the cache is too big, the oldest entries are removed first."""
+        result_cache = cache.ResultCache(self.code_file, self.cache_directory, max_bytes=30)
+        for part in range(1, 5):
+            key = result_cache.key(self.input_file, 1, part, 'part1', {})
+            result_cache.put(key, part)
+            entry_name = os.path.join(self.cache_directory, key + cache.CACHE_SUFFIX)
+            os.utime(entry_name, (part, part))
+
+        result_cache.evict()
+        remaining = [result_cache.get(result_cache.key(self.input_file, 1, part, 'part1', {})) for part in range(1, 5)]
+        self.assertEqual(remaining, [None, None, 3, 4])
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
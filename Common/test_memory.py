@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+import unittest.mock
+import Common.memory as memory
+
+
+def build_list(size: int) -> list[int]:
+    return list(range(size))
+
+
+def build_and_drop(size: int) -> int:
+    return len(build_list(size))
+
+
+def keep_list(size: int) -> list[int]:
+    return build_list(size)
+
+
+class TestMemory(unittest.TestCase):
+    def setUp(self):
+        memory.MEMORY_STATS.clear()
+        memory.STAGE_MEMORY_STATS.clear()
+        memory.CALL_STACK.clear()
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+
+    # --- Test: instrument_memory ---
+    def test_instrument_memory_peak_and_net(self):
+        """A temporary list counts in the peak only, a returned list also counts in the net."""
+        # Instrument this module, so the nested calls go through the wrappers too.
+        namespace = globals()
+        self.addCleanup(namespace.update, {'build_list': build_list, 'build_and_drop': build_and_drop, 'keep_list': keep_list})
+        memory.instrument_memory(namespace, {'parse': ['build_list'], 'solve': ['build_and_drop', 'keep_list']})
+
+        self.assertEqual(namespace['build_and_drop'](100_000), 100_000)
+        kept = namespace['keep_list'](100_000)
+
+        list_bytes = 100_000 * 8
+        self.assertEqual(memory.MEMORY_STATS['build_and_drop'].calls, 1)
+        self.assertGreater(memory.MEMORY_STATS['build_and_drop'].peak_bytes, list_bytes)
+        self.assertLess(memory.MEMORY_STATS['build_and_drop'].net_bytes, list_bytes)
+        self.assertGreater(memory.MEMORY_STATS['keep_list'].net_bytes, list_bytes)
+        self.assertEqual(len(kept), 100_000)
+
+        # Nested calls are reported for their function, and for their stage unless nested in the same stage.
+        self.assertEqual(memory.MEMORY_STATS['build_list'].calls, 2)
+        self.assertEqual(memory.STAGE_MEMORY_STATS['solve'].calls, 2)
+        self.assertEqual(memory.STAGE_MEMORY_STATS['parse'].calls, 2)
+        self.assertGreater(memory.STAGE_MEMORY_STATS['solve'].peak_bytes, list_bytes)
+
+        # The site that built the list is the biggest allocation of the first call.
+        top_site = memory.MEMORY_STATS['build_and_drop'].top_sites[0]
+        self.assertTrue(top_site['site'].startswith(os.path.abspath(__file__)))
+        self.assertEqual(memory.CALL_STACK, [])
+
+    def test_instrument_memory_not_tracing(self):
+        """Without tracemalloc running, wrapped functions run as before and record nothing."""
+        tracemalloc.stop()
+        namespace = {'build_list': build_list}
+        memory.instrument_memory(namespace, {'parse': ['build_list']})
+
+        self.assertEqual(len(namespace['build_list'](10)), 10)
+        self.assertEqual(memory.MEMORY_STATS['build_list'].calls, 0)
+
+    # --- Test: memory_output ---
+    def test_memory_output(self):
+        """The flag and the environment variable report to stderr, a .json value reports to that file."""
+        with unittest.mock.patch.dict('os.environ', {}, clear=True):
+            self.assertIsNone(memory.memory_output(['main_day01.py']))
+            self.assertEqual(memory.memory_output(['main_day01.py', '--memory']), '-')
+        with unittest.mock.patch.dict('os.environ', {'AOC_MEMORY': '1'}):
+            self.assertEqual(memory.memory_output(['main_day01.py']), '-')
+        with unittest.mock.patch.dict('os.environ', {'AOC_MEMORY': 'report.json'}):
+            self.assertEqual(memory.memory_output(['main_day01.py']), 'report.json')
+
+    # --- Test: write_report ---
+    def test_write_report(self):
+        """The report is JSON, with every stage and function."""
+        namespace = {'build_list': build_list}
+        memory.instrument_memory(namespace, {'read_input': ['build_list']})
+        namespace['build_list'](1000)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_name = os.path.join(tmp_dir, 'memory.json')
+            memory.write_report(report_name)
+            with open(report_name) as report_file:
+                report = json.load(report_file)
+
+        self.assertEqual(report['stages']['read_input']['calls'], 1)
+        self.assertEqual(report['functions']['build_list']['stage'], 'read_input')
+        self.assertGreater(report['traced_peak_bytes'], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
@@ -0,0 +1,108 @@
+import contextlib
+import gzip
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+import Common.runner as runner
+import Common.timing as timing
+
+ROTATIONS: str = 'L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n'
+PRODUCT_ID_RANGES: str = (
+    '11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,'
+    '446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124'
+)
+
+
+class TestRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, content: str) -> str:
+        file_name = os.path.join(self.tmp_dir.name, 'input.txt')
+        with open(file_name, 'w') as input_file:
+            input_file.write(content)
+        return file_name
+
+    def run_main(self, arguments: list[str]) -> tuple[dict[int, int], str]:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            answers = runner.main([*arguments, '--no-cache'])
+        return answers, output.getvalue()
+
+    # --- Test: main ---
+    def test_main_day01(self):
+        """Both parts are solved with the default engines."""
+        answers, output = self.run_main(['1', '--input', self.write(ROTATIONS)])
+        self.assertEqual(answers, {1: 3, 2: 6})
+        self.assertEqual(output, 'PW Part 1: 3\nPW Part 2: 6\n')
+
+    def test_main_day01_parameters(self):
+        """The start and lock size are passed to the solver."""
+        answers, _ = self.run_main(['1', '--input', self.write('R10\nL20\n'), '--start', '0', '--lock-size', '10', '--part', '1'])
+        self.assertEqual(answers, {1: 2})
+
+    def test_main_day01_streamed(self):
+        """A single loop-based part streams a gzip input without compiling it, other runs compile it once."""
+        input_file = os.path.join(self.tmp_dir.name, 'input.txt.gz')
+        with gzip.open(input_file, 'wt') as gz_file:
+            gz_file.write(ROTATIONS)
+
+        module, _ = runner.load_day(1)
+        with unittest.mock.patch.object(module.CompiledRotations, 'from_lines', side_effect=AssertionError('input was compiled')):
+            self.assertEqual(self.run_main(['1', '--input', input_file, '--part', '2'])[0], {2: 6})
+            self.assertEqual(self.run_main(['1', '--input', input_file, '--engine', 'part1'])[0], {1: 3})
+
+        with unittest.mock.patch.object(module.CompiledRotations, 'from_lines', wraps=module.CompiledRotations.from_lines) as from_lines:
+            self.assertEqual(self.run_main(['1', '--input', input_file])[0], {1: 3, 2: 6})
+        self.assertEqual(from_lines.call_count, 1)
+
+    def test_main_timing_startup_is_cpu_time(self):
+        """The startup row is labelled as CPU time, as it is not wall time like the other rows."""
+        module, _ = runner.load_day(1)
+        # --timing wraps the stage functions of the module in place, put the originals back afterwards.
+        names: list[str] = [name for names in module.TIMING_STAGES.values() for name in names]
+        self.addCleanup(vars(module).update, {name: getattr(module, name) for name in names})
+        timing.STAGE_STATS.clear()
+        self.addCleanup(timing.STAGE_STATS.clear)
+        with unittest.mock.patch('atexit.register'):
+            self.run_main(['1', '--input', self.write(ROTATIONS), '--timing'])
+        self.assertIn('startup (CPU time)', timing.STAGE_STATS)
+
+    def test_main_day02(self):
+        """Every engine of a part gives the same answer."""
+        input_file = self.write(PRODUCT_ID_RANGES)
+        for engine in ('part1', 'part1_arithmetic', 'digit_dp'):
+            with self.subTest(engine=engine):
+                self.assertEqual(self.run_main(['2', '--input', input_file, '--engine', engine])[0], {1: 1227775554})
+        for engine in ('part2', 'part2_arithmetic'):
+            with self.subTest(engine=engine):
+                self.assertEqual(self.run_main(['2', '--input', input_file, '--engine', engine])[0], {2: 4174379265})
+
+    # --- Test: select_method ---
+    def test_select_method_errors(self):
+        """Unknown engines and engines of the other part are rejected."""
+        module, _ = runner.load_day(1)
+        self.assertIs(runner.select_method(module, 1, 2, None), module.Methods.part2_closed_form)
+        with self.assertRaises(ValueError):
+            runner.select_method(module, 1, 1, 'part3')
+        with self.assertRaises(ValueError):
+            runner.select_method(module, 1, 2, 'part1')
+        with self.assertRaises(ValueError):
+            runner.load_day(99)
+
+    # --- Test: lazy loading ---
+    def test_import_is_lazy(self):
+        """Importing the runner imports no day module, and no tracemalloc unless memory profiling is requested."""
+        repository_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "import sys, Common.runner; print(sorted(name for name in sys.modules if name.startswith('Day') or name == 'tracemalloc'))"
+        output = subprocess.run([sys.executable, '-c', code], cwd=repository_directory, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), '[]')
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import unittest.mock
+import Common.timing as timing
+
+
+def double_all(values: list[int]) -> list[int]:
+    return [value * 2 for value in values]
+
+
+def total(values: list[int]) -> int:
+    return sum(double_all(values))
+
+
+class TestTiming(unittest.TestCase):
+    def setUp(self):
+        timing.STAGE_STATS.clear()
+
+    # --- Test: instrument_stages ---
+    def test_instrument_stages_counts_calls_and_items(self):
+        """Wrapped functions should record calls and items, including calls made through the module globals."""
+        namespace = {'double_all': double_all, 'total': total}
+        timing.instrument_stages(namespace, {'parse': ['double_all'], 'solve': ['total']})
+
+        self.assertEqual(namespace['total']([1, 2, 3]), 12)
+        self.assertEqual(namespace['total']([4]), 8)
+
+        self.assertEqual(timing.STAGE_STATS['total'].stage, 'solve')
+        self.assertEqual(timing.STAGE_STATS['total'].calls, 2)
+        self.assertEqual(timing.STAGE_STATS['total'].items, 4)
+        self.assertGreaterEqual(timing.STAGE_STATS['total'].seconds, 0)
+
+    def test_count_items(self):
+        """Items come from the biggest collection argument or result, and are at least 1."""
+        self.assertEqual(timing.count_items(('input.txt',), ['a', 'b']), 2)
+        self.assertEqual(timing.count_items((5, [1, 2, 3]), 7), 3)
+        self.assertEqual(timing.count_items((1188511885,), []), 1)
+
+    # --- Test: timing_format ---
+    def test_timing_format_disabled_by_default(self):
+        """Nothing should be enabled without the flag or the environment variable."""
+        with unittest.mock.patch.dict('os.environ', {}, clear=True):
+            self.assertIsNone(timing.timing_format(['main_day01.py']))
+            self.assertFalse(timing.enable_stage_timing({}, {'solve': ['missing']}, ['main_day01.py']))
+
+    def test_timing_format_requested(self):
+        """The flag and the environment variable should both enable timing."""
+        with unittest.mock.patch.dict('os.environ', {}, clear=True):
+            self.assertEqual(timing.timing_format(['main_day01.py', '--timing']), 'text')
+        with unittest.mock.patch.dict('os.environ', {'AOC_TIMING': 'json'}):
+            self.assertEqual(timing.timing_format(['main_day01.py']), 'json')
+
+    def test_format_report_json(self):
+        """The JSON report should list every instrumented function."""
+        namespace = {'total': total}
+        timing.instrument_stages(namespace, {'solve': ['total']})
+        namespace['total']([1, 2])
+        self.assertIn('"total"', timing.format_report('json'))
+        self.assertIn('solve', timing.format_report('text'))
+
+
+if __name__ == '__main__':
+    _ = unittest.main()
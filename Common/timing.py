@@ -0,0 +1,141 @@
+# Advent of Code 2025 - Common - Opt-in per stage timing
+# Done by: johanaxel007
+#
+# Enabled with the --timing flag or the AOC_TIMING environment variable (AOC_TIMING=text or AOC_TIMING=json).
+# When disabled nothing is wrapped, so the instrumented functions run exactly as before.
+
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Sized
+from typing import Any
+
+TIMING_FLAG: str = '--timing'
+TIMING_ENVIRONMENT_VARIABLE: str = 'AOC_TIMING'
+
+
+class StageStats:
+    """
+    Wall time, call count and number of items handled by one instrumented function.
+    """
+
+    __slots__ = ('stage', 'calls', 'seconds', 'items')
+
+    def __init__(self, stage: str):
+        self.stage: str = stage
+        self.calls: int = 0
+        self.seconds: float = 0.0
+        self.items: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'stage': self.stage,
+            'calls': self.calls,
+            'seconds': self.seconds,
+            'items': self.items,
+            'items_per_second': self.items / self.seconds if self.seconds > 0 else None,
+        }
+
+
+# Function name -> stats, filled in by the wrappers of instrument_stages.
+STAGE_STATS: dict[str, StageStats] = {}
+
+
+def count_items(args: tuple, result: Any) -> int:
+    """
+    Guess how many items a call handled: the length of its biggest collection argument or result, and at least 1.
+    :param args: The positional arguments of the call.
+    :param result: The return value of the call.
+    :return: Number of items.
+    """
+    sizes: list[int] = [len(value) for value in (*args, result) if isinstance(value, Sized) and not isinstance(value, (str, bytes))]
+    return max([1, *sizes])
+
+
+def timed(stage: str, name: str, function: Callable) -> Callable:
+    """
+    Wrap a function so every call adds to its StageStats.
+    :param stage: The stage the function belongs to. ex: 'parse'
+    :param name: The name to report the function under.
+    :param function: The function to wrap.
+    :return: The wrapped function.
+    """
+    stats: StageStats = STAGE_STATS.setdefault(name, StageStats(stage))
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start_time: float = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            stats.seconds += time.perf_counter() - start_time
+            stats.calls += 1
+
+        stats.items += count_items(args, result)
+        return result
+
+    return wrapper
+
+
+def instrument_stages(namespace: dict[str, Any], stages: dict[str, list[str]]) -> None:
+    """
+    Replace the functions of a module namespace with timed wrappers. Callers inside the module pick them up through the global lookup.
+    :param namespace: The module globals. ex: globals()
+    :param stages: Stage -> names of the functions in that stage. ex: {'parse': ['parse_line']}
+    """
+    for stage, names in stages.items():
+        for name in names:
+            namespace[name] = timed(stage, name, namespace[name])
+
+
+def timing_format(argv: list[str] | None = None) -> str | None:
+    """
+    Find out if timing was requested, and how it should be reported.
+    :param argv: Command line arguments (default: sys.argv).
+    :return: 'text' or 'json', or None when timing is disabled.
+    """
+    argv = sys.argv if argv is None else argv
+    requested: str = os.environ.get(TIMING_ENVIRONMENT_VARIABLE, '').strip().lower()
+
+    if requested == 'json':
+        return 'json'
+    if TIMING_FLAG in argv or requested not in ('', '0', 'false', 'no', 'off'):
+        return 'text'
+    return None
+
+
+def format_report(output_format: str) -> str:
+    """
+    Format the collected stats. Times are inclusive, so a solve stage includes the parse calls it makes.
+    :param output_format: 'text' or 'json'
+    :return: The report.
+    """
+    if output_format == 'json':
+        return json.dumps({name: stats.as_dict() for name, stats in STAGE_STATS.items()}, indent=2)
+
+    lines: list[str] = ['{:<10} {:<30} {:>10} {:>12} {:>14} {:>16}'.format('Stage', 'Function', 'Calls', 'Seconds', 'Items', 'Items/s')]
+    for name, stats in STAGE_STATS.items():
+        rate: str = '-' if stats.seconds <= 0 else '{:,.0f}'.format(stats.items / stats.seconds)
+        lines.append('{:<10} {:<30} {:>10,} {:>12.6f} {:>14,} {:>16}'.format(stats.stage, name, stats.calls, stats.seconds, stats.items, rate))
+
+    return '\n'.join(lines)
+
+
+def enable_stage_timing(namespace: dict[str, Any], stages: dict[str, list[str]], argv: list[str] | None = None) -> bool:
+    """
+    Instrument the given stages and print a report to stderr at exit, if timing was requested.
+    :param namespace: The module globals. ex: globals()
+    :param stages: Stage -> names of the functions in that stage.
+    :param argv: Command line arguments (default: sys.argv).
+    :return: True if timing is enabled.
+    """
+    output_format: str | None = timing_format(argv)
+    if output_format is None:
+        return False
+
+    instrument_stages(namespace, stages)
+    atexit.register(lambda: print(format_report(output_format), file=sys.stderr))
+    return True
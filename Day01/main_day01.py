@@ -3,12 +3,49 @@
 # Done by: johanaxel007
 
 
+import gzip
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sized
 from enum import StrEnum
+from itertools import repeat
+
+
+ROTATION_BYTES: bytes = b'LR0123456789\r\n'
+ROTATION_SIGNS: bytes = bytes.maketrans(b'LR', b'-+')
+
+# Sidecar header: magic, size and mtime of the source input file, so a changed input is never served stale steps,
+# then the number of rotations that follow, so a truncated sidecar is never served either.
+SIDECAR_SUFFIX: str = '.rotations'
+SIDECAR_MAGIC: bytes = b'AOC25D1R'
+SIDECAR_HEADER: struct.Struct = struct.Struct('<8sqqq')
+
+# Raw input is parsed this many bytes at a time, so parsing only needs a few copies of a chunk on top of the array of steps.
+PARSE_CHUNK_SIZE: int = 1 << 16
+
+# Stage -> functions instrumented with --timing and --memory (see Common.timing and Common.memory).
+TIMING_STAGES: dict[str, list[str]] = {
+    'read_input': ['read_input', 'read_input_array', 'read_input_compiled'],
+    'parse': ['parse_line', 'parse_input_bytes'],
+    'solve': ['calculate_password', 'calculate_password_parallel'],
+}
 
 
 class Methods(StrEnum):
     part1 = 'apply_rotation'
     part2 = 'apply_rotation_single_tick'
+    part2_closed_form = 'apply_rotation_closed_form'
+    part1_vectorized = 'count_zero_landings_vectorized'
+    part2_vectorized = 'count_zero_passes_vectorized'
+
+
+# Methods counting every click that passes 0 (Part 2), as opposed to only the rotations that end on 0 (Part 1).
+PASSING_METHODS: frozenset[Methods] = frozenset({Methods.part2, Methods.part2_closed_form, Methods.part2_vectorized})
+
+# Methods needing every rotation at once in a NumPy array, the other methods can stream the rotations.
+VECTORIZED_METHODS: frozenset[Methods] = frozenset({Methods.part1_vectorized, Methods.part2_vectorized})
 
 
 def read_input(file_name: str) -> list[str]:
@@ -21,6 +58,33 @@ def read_input(file_name: str) -> list[str]:
     return [line.strip() for line in input_raw if line.strip() != '']
 
 
+def stream_rotations(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily strip the lines of an iterator or file handle, skipping empty lines.
+    :param lines: Any iterable of raw lines. ex: an open file, sys.stdin
+    :return: Iterator of stripped rotation strings
+    """
+    for line in lines:
+        line = line.strip()
+        if line != '':
+            yield line
+
+
+def stream_input(file_name: str) -> Iterator[str]:
+    """
+    Read the input file one line at a time, so only the current line is held in memory.
+    :param file_name: ex: input.txt, input.txt.gz (gzip compressed) or '-' (stdin)
+    :return: Iterator of stripped rotation strings
+    """
+    if file_name == '-':
+        yield from stream_rotations(sys.stdin)
+        return
+
+    opener = gzip.open if file_name.endswith('.gz') else open
+    with opener(file_name, 'rt') as input_file:
+        yield from stream_rotations(input_file)
+
+
 def parse_line(line: str) -> int:
     """
     Parse a line of input and return an integer.
@@ -38,6 +102,205 @@ def parse_line(line: str) -> int:
         raise ValueError('Invalid rotation_step: ' + rotation)
 
 
+def count_line_breaks(input_raw: bytes) -> int:
+    """
+    Count the line breaks of raw input the way bytes.splitlines() splits it: \n, \r\n and a lone \r.
+    :param input_raw: ex: b'L68\r\nR48\n'
+    :return: Number of line breaks. ex: 2
+    """
+    return input_raw.count(b'\n') + input_raw.count(b'\r') - input_raw.count(b'\r\n')
+
+
+def iterate_line_chunks(input_raw: bytes, chunk_size: int) -> Iterator[bytes]:
+    """
+    Cut raw input into slices of about chunk_size bytes, each ending right after a \n (except the last one), so no line is split.
+    :param input_raw: ex: b'L68\nR48\n'
+    :param chunk_size: Target size of a slice, a longer line gives a longer slice.
+    :return: Iterator of slices.
+    """
+    start: int = 0
+    while start < len(input_raw):
+        end: int = input_raw.rfind(b'\n', start, start + chunk_size) + 1
+        if end <= start:
+            end = input_raw.find(b'\n', start + chunk_size) + 1 or len(input_raw)
+        yield input_raw[start:end]
+        start = end
+
+
+def parse_rotation_chunk(input_raw: bytes, first_line: int) -> array:
+    """
+    Parse a slice of whole lines into rotation steps, see parse_input_bytes.
+    :param input_raw: ex: b'L68\nR48\n'
+    :param first_line: Line number of the first line of the slice, for the error messages.
+    :return: Signed 64-bit array of rotation steps. ex: array('q', [-68, 48])
+    """
+    if not input_raw.translate(None, ROTATION_BYTES) and input_raw.count(b'\r') == input_raw.count(b'\r\n'):
+        signed_raw: bytes = input_raw.translate(ROTATION_SIGNS, b'\r')
+        signed_lines: list[bytes] = signed_raw.split()
+
+        # int() accepts at most one leading sign, so one sign per line means every line is exactly <sign><digits>.
+        if signed_raw.count(b'-') + signed_raw.count(b'+') == len(signed_lines):
+            try:
+                return array('q', map(int, signed_lines))
+            except (ValueError, OverflowError):
+                pass
+
+    # Lines are decoded one at a time, so invalid UTF-8 and steps too big for 64 bits are reported with their line number too.
+    rotation_steps: array = array('q')
+    for line_number, raw_line in enumerate(input_raw.splitlines(), start=first_line):
+        try:
+            line: str = raw_line.decode().strip()
+            if line == '':
+                continue
+            rotation_steps.append(parse_line(line))
+        except (ValueError, OverflowError) as error:
+            raise ValueError('Invalid rotation on line ' + str(line_number) + ': ' + str(error)) from error
+
+    return rotation_steps
+
+
+def parse_input_bytes(input_raw: bytes, first_line: int = 1) -> array:
+    """
+    Parse the raw bytes of an input file into a compact array of rotation steps, PARSE_CHUNK_SIZE bytes at a time so the temporary copies stay small.
+    Plain input (only L, R, digits and line breaks) is converted by swapping L/R for -/+ and letting int() parse every line.
+    Anything else falls back to parse_line one line at a time, so the same input is accepted and rejected.
+    :param input_raw: ex: b'L68\nR48\n'
+    :param first_line: Line number of the first line, when input_raw is a part of a file.
+    :return: Signed 64-bit array of rotation steps. ex: array('q', [-68, 48])
+    """
+    rotation_steps: array = array('q')
+    for chunk in iterate_line_chunks(input_raw, PARSE_CHUNK_SIZE):
+        rotation_steps += parse_rotation_chunk(chunk, first_line)
+        first_line += count_line_breaks(chunk)
+
+    return rotation_steps
+
+
+def read_input_array(file_name: str) -> array:
+    """
+    Read the input file as raw bytes, PARSE_CHUNK_SIZE bytes at a time, and parse it into a compact array of rotation steps.
+    :param file_name: ex: input.txt
+    :return: Signed 64-bit array of rotation steps. ex: array('q', [-68, 48])
+    """
+    rotation_steps: array = array('q')
+    first_line: int = 1
+    pending: bytes = b''
+
+    with open(file_name, 'rb') as input_file:
+        while block := input_file.read(PARSE_CHUNK_SIZE):
+            # Only whole lines are parsed, the end of the last line is kept for the next block.
+            end: int = block.rfind(b'\n') + 1
+            if end == 0:
+                pending += block
+                continue
+
+            lines: bytes = pending + block[:end]
+            pending = block[end:]
+            rotation_steps += parse_input_bytes(lines, first_line)
+            first_line += count_line_breaks(lines)
+
+    rotation_steps += parse_input_bytes(pending, first_line)
+    return rotation_steps
+
+
+class CompiledRotations:
+    """
+    Rotations parsed once into a compact array of signed steps (eg: L68 -> -68), reusable by every Methods value.
+    """
+
+    __slots__ = ('rotation_steps',)
+
+    def __init__(self, rotation_steps: array):
+        self.rotation_steps: array = rotation_steps
+
+    def __len__(self) -> int:
+        return len(self.rotation_steps)
+
+    @classmethod
+    def from_lines(cls, rotations: Iterable[str]) -> 'CompiledRotations':
+        """
+        Parse rotation strings (eg: the output of read_input) into compiled rotations.
+        :param rotations: The full rotations list (eg: L68, R48)
+        :return: The compiled rotations.
+        """
+        return cls(array('q', map(parse_line, rotations)))
+
+    def save(self, file_name: str, source_stat: os.stat_result) -> None:
+        """
+        Write the rotation steps to a binary sidecar file. The file is written under a temporary name then renamed, so readers never see it half written.
+        :param file_name: ex: input.txt.rotations
+        :param source_stat: os.stat() of the input file the rotations were parsed from.
+        """
+        rotation_steps: array = self.rotation_steps
+        if sys.byteorder != 'little':
+            rotation_steps = array('q', rotation_steps)
+            rotation_steps.byteswap()
+
+        temporary_name: str = file_name + '.' + str(os.getpid())
+        try:
+            with open(temporary_name, 'wb') as sidecar_file:
+                sidecar_file.write(SIDECAR_HEADER.pack(SIDECAR_MAGIC, source_stat.st_size, source_stat.st_mtime_ns, len(rotation_steps)))
+                rotation_steps.tofile(sidecar_file)
+            os.replace(temporary_name, file_name)
+        except OSError:
+            try:
+                os.remove(temporary_name)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, file_name: str, source_stat: os.stat_result) -> 'CompiledRotations | None':
+        """
+        Read the rotation steps back from a binary sidecar file.
+        :param file_name: ex: input.txt.rotations
+        :param source_stat: os.stat() of the input file the rotations should match.
+        :return: The compiled rotations, or None if the sidecar is missing, corrupt or out of date.
+        """
+        try:
+            with open(file_name, 'rb') as sidecar_file:
+                header: bytes = sidecar_file.read(SIDECAR_HEADER.size)
+                payload: bytes = sidecar_file.read()
+        except OSError:
+            return None
+
+        if len(header) != SIDECAR_HEADER.size:
+            return None
+        if SIDECAR_HEADER.unpack(header) != (SIDECAR_MAGIC, source_stat.st_size, source_stat.st_mtime_ns, len(payload) // 8) or len(payload) % 8 != 0:
+            return None
+
+        rotation_steps: array = array('q', payload)
+        if sys.byteorder != 'little':
+            rotation_steps.byteswap()
+
+        return cls(rotation_steps)
+
+
+def read_input_compiled(file_name: str, use_sidecar: bool = False) -> CompiledRotations:
+    """
+    Read and parse the input file once into compiled rotations.
+    :param file_name: ex: input.txt
+    :param use_sidecar: Reuse (or create) a binary sidecar next to the input file (ex: input.txt.rotations), skipping text parsing on later runs.
+    :return: The compiled rotations.
+    """
+    if not use_sidecar:
+        return CompiledRotations(read_input_array(file_name))
+
+    source_stat: os.stat_result = os.stat(file_name)
+    sidecar_name: str = file_name + SIDECAR_SUFFIX
+
+    compiled_rotations: CompiledRotations | None = CompiledRotations.load(sidecar_name, source_stat)
+    if compiled_rotations is None:
+        compiled_rotations = CompiledRotations(read_input_array(file_name))
+        # The sidecar is only a shortcut for later runs, a read-only directory or a full disk should not fail this one.
+        try:
+            compiled_rotations.save(sidecar_name, source_stat)
+        except OSError:
+            pass
+
+    return compiled_rotations
+
+
 def calculate_new_lock_value(rotation_step: int, current_lock_value: int, lock_size: int) -> int:
     """
     Calculate the new lock value after a rotation. Accounts for the lock being circular by making sure the value is always between 0 and lock_size - 1.
@@ -100,19 +363,114 @@ def apply_rotation_single_tick(rotation: int, current_lock_value: int, lock_size
     return new_value, at_zero_count
 
 
-def calculate_password(start: int, rotations: list[str], lock_size: int = 100, method: Methods = Methods.part1) -> int:
+def apply_rotation_closed_form(rotation: int, current_lock_value: int, lock_size: int) -> tuple[int, int]:
+    """
+    Apply a full rotation to the lock and return the new lock value and the number of times the lock was passed 0 using 0x434C49434B method.
+    Gives the same result as apply_rotation_single_tick, but counts the laps with floor division instead of ticking, so it runs in O(1).
+    :param rotation: The full rotation (eg: -68 or 48)
+    :param current_lock_value: The current value of the lock.
+    :param lock_size: The max bound of the lock.
+    :return: Tuple of (new_lock_value, at_zero_count)
+    """
+    new_value: int = (current_lock_value + rotation) % lock_size
+
+    # Distance to travel before the first click that lands on 0 (a full lap when already sitting on 0).
+    if rotation > 0:
+        distance_to_zero: int = (lock_size - current_lock_value) % lock_size
+    else:
+        distance_to_zero = current_lock_value % lock_size
+
+    if distance_to_zero == 0:
+        distance_to_zero = lock_size
+
+    rotation_steps: int = abs(rotation)
+    if rotation_steps < distance_to_zero:
+        return new_value, 0
+
+    at_zero_count: int = 1 + (rotation_steps - distance_to_zero) // lock_size
+
+    return new_value, at_zero_count
+
+
+def calculate_lock_positions_vectorized(start: int, rotations: Iterable[str] | CompiledRotations):
+    """
+    Parse every rotation into a NumPy array and calculate the unwrapped lock positions with a single cumulative sum.
+    Positions are not taken modulo the lock size, so the number of laps between two positions is just a floor division away.
+    :param start: The starting point of the lock
+    :param rotations: The full rotations list (eg: L68, R48) or compiled rotations
+    :return: Tuple of (rotation_steps, positions_before, positions_after) as int64 arrays
+    """
+    import numpy as np
+
+    if isinstance(rotations, CompiledRotations):
+        rotation_steps = np.frombuffer(rotations.rotation_steps, dtype=np.int64)
+    else:
+        count: int = len(rotations) if isinstance(rotations, Sized) else -1
+        rotation_steps = np.fromiter((parse_line(rotation) for rotation in rotations), dtype=np.int64, count=count)
+    positions_after = start + np.cumsum(rotation_steps)
+    positions_before = np.concatenate(([start], positions_after[:-1]))
+
+    return rotation_steps, positions_before, positions_after
+
+
+def count_zero_landings_vectorized(start: int, rotations: Iterable[str] | CompiledRotations, lock_size: int) -> int:
+    """
+    Count how many rotations leave the lock at 0, using NumPy array operations instead of a Python loop.
+    :param start: The starting point of the lock
+    :param rotations: The full rotations list (eg: L68, R48) or compiled rotations
+    :param lock_size: The max bound of the lock.
+    :return: The password (Part 1).
+    """
+    _, _, positions_after = calculate_lock_positions_vectorized(start, rotations)
+
+    return int((positions_after % lock_size == 0).sum())
+
+
+def count_zero_passes_vectorized(start: int, rotations: Iterable[str] | CompiledRotations, lock_size: int) -> int:
+    """
+    Count how many clicks leave the lock at 0 using 0x434C49434B method, using NumPy array operations instead of a Python loop.
+    Moving right from a to b passes the multiples of lock_size in (a, b], moving left passes the ones in [b, a).
+    :param start: The starting point of the lock
+    :param rotations: The full rotations list (eg: L68, R48) or compiled rotations
+    :param lock_size: The max bound of the lock.
+    :return: The password (Part 2).
+    """
+    import numpy as np
+
+    rotation_steps, positions_before, positions_after = calculate_lock_positions_vectorized(start, rotations)
+
+    passes_right = positions_after // lock_size - positions_before // lock_size
+    passes_left = (positions_before - 1) // lock_size - (positions_after - 1) // lock_size
+
+    return int(np.where(rotation_steps > 0, passes_right, passes_left).sum())
+
+
+def calculate_password(start: int, rotations: Iterable[str] | CompiledRotations, lock_size: int = 100, method: Methods = Methods.part1) -> int:
     """
     Calculate the password by counting how many times the lock points at 0 after each rotation.
+    The loop methods only keep the running lock value, so rotations can be streamed (see stream_input) in constant memory.
     :param start: The starting point of the lock
-    :param rotations: The full rotations list (eg: L68, R48)
+    :param rotations: The full rotations list or iterator (eg: L68, R48), or compiled rotations to skip parsing
     :param lock_size: The max bound of the lock.
+    :param method: The method used to apply each rotation.
     :return: The password.
     """
+    match method:
+        case Methods.part1_vectorized:
+            return count_zero_landings_vectorized(start, rotations, lock_size)
+        case Methods.part2_vectorized:
+            return count_zero_passes_vectorized(start, rotations, lock_size)
+
+    rotation_values: Iterable[int]
+    if isinstance(rotations, CompiledRotations):
+        rotation_values = rotations.rotation_steps
+    else:
+        rotation_values = map(parse_line, rotations)
+
     current_lock_value: int = start
     at_zero_count_total: int = 0
 
-    for rotation in rotations:
-        rotation_value: int = parse_line(rotation)
+    for rotation_value in rotation_values:
         new_value: int = current_lock_value
         at_zero_count: int = 0
 
@@ -121,6 +479,8 @@ def calculate_password(start: int, rotations: list[str], lock_size: int = 100, m
                 new_value, at_zero_count = apply_rotation(rotation_value, current_lock_value, lock_size)
             case Methods.part2:
                 new_value, at_zero_count = apply_rotation_single_tick(rotation_value, current_lock_value, lock_size)
+            case Methods.part2_closed_form:
+                new_value, at_zero_count = apply_rotation_closed_form(rotation_value, current_lock_value, lock_size)
 
         current_lock_value = new_value
         at_zero_count_total += at_zero_count
@@ -128,15 +488,345 @@ def calculate_password(start: int, rotations: list[str], lock_size: int = 100, m
     return at_zero_count_total
 
 
+class RotationSummary:
+    """
+    Summary of a run of rotations that does not depend on where the lock starts:
+    the net displacement, and the number of zero hits for every possible starting value (a table of lock_size entries).
+    """
+
+    __slots__ = ('displacement', 'zero_counts')
+
+    def __init__(self, displacement: int, zero_counts: list[int]):
+        self.displacement: int = displacement
+        self.zero_counts: list[int] = zero_counts
+
+    def combine(self, other: 'RotationSummary') -> 'RotationSummary':
+        """
+        Summarize this run of rotations followed by another one.
+        :param other: The summary of the rotations applied after this one.
+        :return: The combined summary.
+        """
+        lock_size: int = len(self.zero_counts)
+        zero_counts: list[int] = [
+            at_zero_count + other.zero_counts[(start + self.displacement) % lock_size]
+            for start, at_zero_count in enumerate(self.zero_counts)
+        ]
+        return RotationSummary(self.displacement + other.displacement, zero_counts)
+
+
+def summarize_rotations(rotation_steps: Iterable[int], lock_size: int, count_passes: bool) -> RotationSummary:
+    """
+    Summarize a run of rotation steps for every starting value at once, in O(len(rotation_steps) + lock_size).
+    Positions are tracked relative to the start, so a start s lands on 0 after a rotation when the relative position is -s (mod lock_size).
+    When counting passes, each rotation adds floor((s + x) / lock_size) terms, which are a constant plus a step at s = lock_size - x % lock_size.
+    :param rotation_steps: The rotation steps (eg: -68 or 48)
+    :param lock_size: The max bound of the lock.
+    :param count_passes: Count every click on 0 (Part 2) instead of only the rotations ending on 0 (Part 1).
+    :return: The summary of the rotations.
+    """
+    position: int = 0
+
+    if not count_passes:
+        residue_counts: list[int] = [0] * lock_size
+        for rotation_step in rotation_steps:
+            position += rotation_step
+            residue_counts[position % lock_size] += 1
+
+        return RotationSummary(position, [residue_counts[-start % lock_size] for start in range(lock_size)])
+
+    at_zero_count_base: int = 0
+    at_zero_count_steps: list[int] = [0] * lock_size
+
+    for rotation_step in rotation_steps:
+        previous_position: int = position
+        position += rotation_step
+
+        # Right passes the multiples of lock_size in (s + before, s + after], left passes the ones in [s + after, s + before).
+        if rotation_step > 0:
+            upper, lower = position, previous_position
+        elif rotation_step < 0:
+            upper, lower = previous_position - 1, position - 1
+        else:
+            continue
+
+        at_zero_count_base += upper // lock_size - lower // lock_size
+        if upper % lock_size:
+            at_zero_count_steps[lock_size - upper % lock_size] += 1
+        if lower % lock_size:
+            at_zero_count_steps[lock_size - lower % lock_size] -= 1
+
+    zero_counts: list[int] = []
+    for at_zero_count_step in at_zero_count_steps:
+        at_zero_count_base += at_zero_count_step
+        zero_counts.append(at_zero_count_base)
+
+    return RotationSummary(position, zero_counts)
+
+
+def fold_summaries(start: int, summaries: Iterable[RotationSummary], lock_size: int) -> int:
+    """
+    Walk the lock through consecutive summaries, left to right, and add up their zero hits.
+    :param start: The starting point of the lock
+    :param summaries: The summaries of consecutive runs of rotations.
+    :param lock_size: The max bound of the lock.
+    :return: The password.
+    """
+    current_lock_value: int = start % lock_size
+    at_zero_count_total: int = 0
+
+    for summary in summaries:
+        at_zero_count_total += summary.zero_counts[current_lock_value]
+        current_lock_value = (current_lock_value + summary.displacement) % lock_size
+
+    return at_zero_count_total
+
+
+def calculate_password_parallel(
+    start: int,
+    rotations: Iterable[str] | CompiledRotations,
+    lock_size: int = 100,
+    method: Methods = Methods.part1,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> int:
+    """
+    Calculate the password by splitting the rotations into chunks, summarizing the chunks across a process pool and folding the summaries.
+    :param start: The starting point of the lock
+    :param rotations: The full rotations list (eg: L68, R48) or compiled rotations
+    :param lock_size: The max bound of the lock.
+    :param method: Any Part 1 or Part 2 method, only used to pick what is counted.
+    :param workers: Number of worker processes (default: os.cpu_count()). 1 runs in this process.
+    :param chunk_size: Number of rotations per chunk (default: an even split across the workers).
+    :return: The password.
+    """
+    if not isinstance(rotations, CompiledRotations):
+        rotations = CompiledRotations.from_lines(rotations)
+
+    rotation_steps: array = rotations.rotation_steps
+    count_passes: bool = method in PASSING_METHODS
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(rotation_steps) // workers))
+
+    chunks: list[array] = [rotation_steps[index : index + chunk_size] for index in range(0, len(rotation_steps), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        summaries: list[RotationSummary] = [summarize_rotations(chunk, lock_size, count_passes) for chunk in chunks]
+    else:
+        # Imported here, the process pool machinery is the slowest import of the module.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(summarize_rotations, chunks, repeat(lock_size), repeat(count_passes)))
+
+    return fold_summaries(start, summaries, lock_size)
+
+
+def calculate_passwords_all_starts(rotations: Iterable[str] | CompiledRotations, lock_size: int = 100) -> tuple[list[int], list[int]]:
+    """
+    Calculate the Part 1 and Part 2 passwords for every starting value 0..lock_size - 1 in O(len(rotations) + lock_size), without re-running per start.
+    :param rotations: The full rotations list (eg: L68, R48) or compiled rotations
+    :param lock_size: The max bound of the lock.
+    :return: Tuple of (part_1_passwords, part_2_passwords), both indexed by starting value.
+    """
+    if not isinstance(rotations, CompiledRotations):
+        rotations = CompiledRotations.from_lines(rotations)
+
+    part_1_summary: RotationSummary = summarize_rotations(rotations.rotation_steps, lock_size, count_passes=False)
+    part_2_summary: RotationSummary = summarize_rotations(rotations.rotation_steps, lock_size, count_passes=True)
+
+    return part_1_summary.zero_counts, part_2_summary.zero_counts
+
+
+def calculate_position_histogram(start: int, rotations: Iterable[str] | CompiledRotations, lock_size: int = 100) -> tuple[list[int], list[int]]:
+    """
+    Count, for every position of the lock, the rotations that ended on it (Part 1) and the clicks that passed it (Part 2), in O(len(rotations) + lock_size).
+    Shifting the lock by p turns the hits on position p into hits on 0, so from a start s they are the zero hits from the start s - p.
+    :param start: The starting point of the lock
+    :param rotations: The full rotations list (eg: L68, R48) or compiled rotations
+    :param lock_size: The max bound of the lock.
+    :return: Tuple of (landed_counts, passed_counts), both indexed by position. landed_counts[0] and passed_counts[0] are the two passwords.
+    """
+    part_1_passwords, part_2_passwords = calculate_passwords_all_starts(rotations, lock_size)
+
+    landed_counts: list[int] = [part_1_passwords[(start - position) % lock_size] for position in range(lock_size)]
+    passed_counts: list[int] = [part_2_passwords[(start - position) % lock_size] for position in range(lock_size)]
+
+    return landed_counts, passed_counts
+
+
+class RotationIndex:
+    """
+    Segment tree of RotationSummary over blocks of block_size rotations, for range zero-count queries and single rotation edits.
+    Whole blocks are answered from the tree in O(log n), the partial blocks at both ends of a range are stepped through directly.
+    """
+
+    __slots__ = ('rotation_steps', 'lock_size', 'count_passes', 'block_size', 'leaf_count', 'tree')
+
+    def __init__(
+        self,
+        rotations: Iterable[str] | CompiledRotations,
+        lock_size: int = 100,
+        method: Methods = Methods.part1,
+        block_size: int = 64,
+    ):
+        if not isinstance(rotations, CompiledRotations):
+            rotations = CompiledRotations.from_lines(rotations)
+
+        self.rotation_steps: array = array('q', rotations.rotation_steps)
+        self.lock_size: int = lock_size
+        self.count_passes: bool = method in PASSING_METHODS
+        self.block_size: int = block_size
+
+        block_count: int = -(-len(self.rotation_steps) // block_size)
+        self.leaf_count: int = 1
+        while self.leaf_count < block_count:
+            self.leaf_count *= 2
+
+        empty_summary: RotationSummary = RotationSummary(0, [0] * lock_size)
+        self.tree: list[RotationSummary] = [empty_summary] * (2 * self.leaf_count)
+
+        for block in range(block_count):
+            self.tree[self.leaf_count + block] = self._summarize_block(block)
+        for node in range(self.leaf_count - 1, 0, -1):
+            self.tree[node] = self.tree[2 * node].combine(self.tree[2 * node + 1])
+
+    def __len__(self) -> int:
+        return len(self.rotation_steps)
+
+    def _summarize_block(self, block: int) -> RotationSummary:
+        block_start: int = block * self.block_size
+        return summarize_rotations(self.rotation_steps[block_start : block_start + self.block_size], self.lock_size, self.count_passes)
+
+    def _step(self, current_lock_value: int, first: int, last: int) -> tuple[int, int]:
+        """
+        Apply the rotations in [first, last) one by one.
+        :return: Tuple of (new_lock_value, at_zero_count)
+        """
+        at_zero_count_total: int = 0
+
+        for rotation in self.rotation_steps[first:last]:
+            if self.count_passes:
+                current_lock_value, at_zero_count = apply_rotation_closed_form(rotation, current_lock_value, self.lock_size)
+                at_zero_count_total += at_zero_count
+            else:
+                current_lock_value = (current_lock_value + rotation) % self.lock_size
+                at_zero_count_total += current_lock_value == 0
+
+        return current_lock_value, at_zero_count_total
+
+    def _walk(self, current_lock_value: int, first: int, last: int) -> tuple[int, int]:
+        """
+        Apply the rotations in [first, last), using the tree for every whole block in between.
+        :return: Tuple of (new_lock_value, at_zero_count)
+        """
+        first_block: int = -(-first // self.block_size)
+        last_block: int = last // self.block_size
+
+        if first_block >= last_block:
+            return self._step(current_lock_value, first, last)
+
+        current_lock_value, at_zero_count_total = self._step(current_lock_value, first, first_block * self.block_size)
+
+        left_nodes: list[int] = []
+        right_nodes: list[int] = []
+        left, right = first_block + self.leaf_count, last_block + self.leaf_count
+        while left < right:
+            if left & 1:
+                left_nodes.append(left)
+                left += 1
+            if right & 1:
+                right -= 1
+                right_nodes.append(right)
+            left //= 2
+            right //= 2
+
+        for node in left_nodes + right_nodes[::-1]:
+            summary: RotationSummary = self.tree[node]
+            at_zero_count_total += summary.zero_counts[current_lock_value]
+            current_lock_value = (current_lock_value + summary.displacement) % self.lock_size
+
+        current_lock_value, at_zero_count = self._step(current_lock_value, last_block * self.block_size, last)
+
+        return current_lock_value, at_zero_count_total + at_zero_count
+
+    def count_zeros(self, start: int, first: int = 0, last: int | None = None) -> int:
+        """
+        Count the zero hits of the rotations in [first, last), for a lock that pointed at start before the first rotation of the log.
+        :param start: The starting point of the lock
+        :param first: Index of the first rotation to count.
+        :param last: Index one past the last rotation to count (default: the end of the log).
+        :return: The number of zero hits within the range.
+        """
+        if last is None:
+            last = len(self.rotation_steps)
+        if not 0 <= first <= last <= len(self.rotation_steps):
+            raise IndexError('Invalid rotation range: ' + str(first) + '-' + str(last))
+
+        current_lock_value, _ = self._walk(start % self.lock_size, 0, first)
+        _, at_zero_count = self._walk(current_lock_value, first, last)
+
+        return at_zero_count
+
+    def update(self, index: int, rotation: str | int) -> None:
+        """
+        Replace a single rotation and refresh the summaries above it.
+        :param index: Index of the rotation to replace.
+        :param rotation: The new rotation (eg: 'L68' or -68)
+        """
+        if not 0 <= index < len(self.rotation_steps):
+            raise IndexError('Invalid rotation index: ' + str(index))
+
+        self.rotation_steps[index] = parse_line(rotation) if isinstance(rotation, str) else rotation
+
+        node: int = self.leaf_count + index // self.block_size
+        self.tree[node] = self._summarize_block(index // self.block_size)
+        node //= 2
+        while node >= 1:
+            self.tree[node] = self.tree[2 * node].combine(self.tree[2 * node + 1])
+            node //= 2
+
+
 if __name__ == '__main__':
-    input_rotations: list[str] = read_input('input.txt')
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from functools import cache
+
+    from Common.cache import cached_answer, open_result_cache
+    from Common.memory import enable_memory_profiling
+    from Common.timing import enable_stage_timing
+
+    enable_stage_timing(globals(), TIMING_STAGES)
+    enable_memory_profiling(globals(), TIMING_STAGES)
+
+    input_file: str = 'input.txt'
     start_point: int = 50
     lock_size: int = 100
+    result_cache = open_result_cache(__file__)
+
+    # Only read when an answer is not cached.
+    @cache
+    def load_rotations() -> CompiledRotations:
+        return read_input_compiled(input_file, use_sidecar=True)
 
     # --- Part 1 ---
-    password_part_1 = calculate_password(start_point, input_rotations, lock_size, Methods.part1)
+    password_part_1 = cached_answer(
+        result_cache,
+        input_file,
+        1,
+        1,
+        Methods.part1,
+        {'start': start_point, 'lock_size': lock_size},
+        lambda: calculate_password(start_point, load_rotations(), lock_size, Methods.part1),
+    )
     print(f'PW Part 1: {password_part_1}')
 
     # --- Part 2 ---
-    password_part_2 = calculate_password(start_point, input_rotations, lock_size, Methods.part2)
+    password_part_2 = cached_answer(
+        result_cache,
+        input_file,
+        1,
+        2,
+        Methods.part2_closed_form,
+        {'start': start_point, 'lock_size': lock_size},
+        lambda: calculate_password(start_point, load_rotations(), lock_size, Methods.part2_closed_form),
+    )
     print(f'PW Part 2: {password_part_2}')
@@ -1,3 +1,9 @@
+import gzip
+import importlib.util
+import io
+import os
+import tempfile
+import tracemalloc
 import unittest
 from unittest.mock import patch, mock_open
 import Day01.main_day01 as day01
@@ -23,6 +29,35 @@ class TestSecretEntrance(unittest.TestCase):
             result = day01.read_input('dummy.txt')
         self.assertEqual(result, ['L10', 'R20'])
 
+    # --- Test: stream_input ---
+    def test_stream_input_with_empty_lines(self):
+        """Test that streaming filters whitespace and empty lines like read_input."""
+        mock_data = 'L10\n\n  \n R20 \n'
+        with patch('builtins.open', mock_open(read_data=mock_data)):
+            result = list(day01.stream_input('dummy.txt'))
+        self.assertEqual(result, ['L10', 'R20'])
+
+    def test_stream_input_gzip(self):
+        """Test that .gz files are decompressed while streaming."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt.gz')
+            with gzip.open(file_name, 'wt') as gz_file:
+                gz_file.write('L68\nR48\n\nL5\n')
+            result = list(day01.stream_input(file_name))
+        self.assertEqual(result, ['L68', 'R48', 'L5'])
+
+    def test_stream_input_stdin(self):
+        """Test that '-' reads from stdin."""
+        with patch('sys.stdin', io.StringIO('L68\n R48\n')):
+            result = list(day01.stream_input('-'))
+        self.assertEqual(result, ['L68', 'R48'])
+
+    def test_calculate_password_from_iterator(self):
+        """calculate_password should consume a one-shot iterator the same as a list."""
+        lines = io.StringIO('R5\n\nL10\nR20\n')
+        result = day01.calculate_password(5, day01.stream_rotations(lines), 10, method=day01.Methods.part2_closed_form)
+        self.assertEqual(result, 4)
+
     # --- Test: parse_line ---
     def test_parse_line_left(self):
         """Test parsing a Left rotation."""
@@ -48,6 +83,148 @@ class TestSecretEntrance(unittest.TestCase):
         with self.assertRaises(ValueError):
             day01.parse_line('Labc')
 
+    # --- Test: parse_input_bytes ---
+    def test_parse_input_bytes_standard(self):
+        """Test parsing a whole file into an array of rotation steps."""
+        result = day01.parse_input_bytes(b'L68\nR48\r\nL5\n')
+        self.assertEqual(result.typecode, 'q')
+        self.assertEqual(result.tolist(), [-68, 48, -5])
+
+    def test_parse_input_bytes_with_empty_lines(self):
+        """Test that whitespace and empty lines are skipped like read_input."""
+        result = day01.parse_input_bytes(b'L10\n\n  \n R20 \n')
+        self.assertEqual(result.tolist(), [-10, 20])
+
+    def test_parse_input_bytes_matches_parse_line(self):
+        """Test that every line gives the same step as parse_line."""
+        rotations = ['L68', 'L30', 'R48', 'L5', 'R60', 'L0', 'R12345']
+        result = day01.parse_input_bytes('\n'.join(rotations).encode())
+        self.assertEqual(result.tolist(), [day01.parse_line(rotation) for rotation in rotations])
+
+    def test_parse_input_bytes_invalid_direction(self):
+        """Test that an invalid direction raises ValueError with its line number."""
+        with self.assertRaisesRegex(ValueError, 'line 3'):
+            day01.parse_input_bytes(b'L10\n\nX10\n')
+
+    def test_parse_input_bytes_malformed_number(self):
+        """Test that missing numbers raise ValueError with their line number."""
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            day01.parse_input_bytes(b'L10\nL\nR5\n')
+        with self.assertRaisesRegex(ValueError, 'line 1'):
+            day01.parse_input_bytes(b'Labc\n')
+        with self.assertRaisesRegex(ValueError, 'line 1'):
+            day01.parse_input_bytes(b'L5 R6\n')
+
+    def test_parse_input_bytes_overflow_and_encoding(self):
+        """Test that steps too big for 64 bits and invalid UTF-8 raise ValueError with their line number."""
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            day01.parse_input_bytes(b'L10\nR99999999999999999999\n')
+        with self.assertRaisesRegex(ValueError, 'line 3'):
+            day01.parse_input_bytes(b'L10\nR5\nL\xff1\n')
+
+    def test_parse_input_bytes_chunks(self):
+        """Test that small chunks, cut anywhere in the input, give the same steps and line numbers as one chunk."""
+        input_raw = b'L68\r\nR48\n\n R5 \rL1234567\nR0\nL3'
+        expected = [-68, 48, 5, -1234567, 0, -3]
+        for chunk_size in range(1, len(input_raw) + 2):
+            with self.subTest(chunk_size=chunk_size), patch.object(day01, 'PARSE_CHUNK_SIZE', chunk_size):
+                self.assertEqual(day01.parse_input_bytes(input_raw).tolist(), expected)
+                with self.assertRaisesRegex(ValueError, 'line 8'):
+                    day01.parse_input_bytes(input_raw + b'\r\nX1\n')
+
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    file_name = os.path.join(tmp_dir, 'input.txt')
+                    with open(file_name, 'wb') as input_file:
+                        input_file.write(input_raw + b'\nR7\r\nL\xff\n')
+                    with self.assertRaisesRegex(ValueError, 'line 9'):
+                        day01.read_input_array(file_name)
+                    with open(file_name, 'wb') as input_file:
+                        input_file.write(input_raw)
+                    self.assertEqual(day01.read_input_array(file_name).tolist(), expected)
+
+    def test_read_input_array_bounded_memory(self):
+        """Test that reading a file only needs the array of steps and a few chunks of memory."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write('L123\nR45\n' * 50_000)
+
+            tracemalloc.start()
+            try:
+                rotation_steps = day01.read_input_array(file_name)
+                _, peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        self.assertEqual(len(rotation_steps), 100_000)
+        self.assertLess(peak_bytes, 8 * len(rotation_steps) * 2 + 20 * day01.PARSE_CHUNK_SIZE)
+
+    # --- Test: CompiledRotations ---
+    def test_compiled_rotations_from_lines(self):
+        """Test compiling read_input output into rotation steps."""
+        compiled = day01.CompiledRotations.from_lines(['L68', 'R48', 'L5'])
+        self.assertEqual(compiled.rotation_steps.tolist(), [-68, 48, -5])
+        self.assertEqual(len(compiled), 3)
+
+    def test_compiled_rotations_every_method(self):
+        """Compiled rotations should give the same password as strings for every method."""
+        rotations = ['L68', 'L30', 'R48', 'L5', 'R60', 'L55', 'L1', 'L99', 'R14', 'L82']
+        compiled = day01.CompiledRotations.from_lines(rotations)
+        for method in day01.Methods:
+            if method in (day01.Methods.part1_vectorized, day01.Methods.part2_vectorized) and importlib.util.find_spec('numpy') is None:
+                continue
+            with self.subTest(method=method):
+                self.assertEqual(
+                    day01.calculate_password(50, compiled, 100, method=method),
+                    day01.calculate_password(50, rotations, 100, method=method),
+                )
+
+    def test_read_input_compiled_sidecar(self):
+        """Test that the sidecar is written, reused, and ignored once the input changes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write('L68\nR48\n')
+
+            first = day01.read_input_compiled(file_name, use_sidecar=True)
+            self.assertTrue(os.path.exists(file_name + day01.SIDECAR_SUFFIX))
+
+            with patch.object(day01, 'read_input_array', side_effect=AssertionError('input was re-parsed')):
+                second = day01.read_input_compiled(file_name, use_sidecar=True)
+            self.assertEqual(second.rotation_steps, first.rotation_steps)
+
+            with open(file_name, 'w') as input_file:
+                input_file.write('L68\nR48\nL5\n')
+            third = day01.read_input_compiled(file_name, use_sidecar=True)
+            self.assertEqual(third.rotation_steps.tolist(), [-68, 48, -5])
+
+    def test_read_input_compiled_sidecar_truncated(self):
+        """A sidecar missing some of its rotations should be ignored, and the input parsed again."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write('L68\nR48\nL5\nR60\n')
+
+            day01.read_input_compiled(file_name, use_sidecar=True)
+            sidecar_name = file_name + day01.SIDECAR_SUFFIX
+            with open(sidecar_name, 'r+b') as sidecar_file:
+                sidecar_file.truncate(day01.SIDECAR_HEADER.size + 2 * 8)
+
+            self.assertIsNone(day01.CompiledRotations.load(sidecar_name, os.stat(file_name)))
+            self.assertEqual(day01.read_input_compiled(file_name, use_sidecar=True).rotation_steps.tolist(), [-68, 48, -5, 60])
+            self.assertEqual(sorted(os.listdir(tmp_dir)), ['input.txt', 'input.txt.rotations'])
+
+    def test_read_input_compiled_sidecar_not_writable(self):
+        """Failing to write the sidecar should still return the parsed rotations."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write('L68\nR48\n')
+
+            with patch.object(day01.CompiledRotations, 'save', side_effect=OSError('Read-only file system')):
+                compiled = day01.read_input_compiled(file_name, use_sidecar=True)
+            self.assertEqual(compiled.rotation_steps.tolist(), [-68, 48])
+
     # --- Test: calculate_new_lock_value (Shared Logic) ---
     def test_calc_lock_no_wrap(self):
         """Test simple addition/subtraction within bounds."""
@@ -200,6 +377,176 @@ class TestSecretEntrance(unittest.TestCase):
         result = day01.calculate_password(5, rotations, 10, method=day01.Methods.part2)
         self.assertEqual(result, 4)
 
+    # ==========================================
+    # Part 2 Specific Tests (Closed Form)
+    # ==========================================
+
+    def test_part2_closed_form_matches_single_tick(self):
+        """Compare against the tick engine for every start and a spread of rotations, including laps both ways."""
+        for start in range(10):
+            for rotation in range(-35, 36):
+                with self.subTest(start=start, rotation=rotation):
+                    self.assertEqual(
+                        day01.apply_rotation_closed_form(rotation, start, 10),
+                        day01.apply_rotation_single_tick(rotation, start, 10),
+                    )
+
+    def test_part2_closed_form_land_on_zero(self):
+        """Test landing exactly on zero."""
+        # Start 1, move -1 -> 0 (Hit!).
+        self.assertEqual(day01.apply_rotation_closed_form(-1, 1, 100), (0, 1))
+        # Start 98, move 2 -> 0 (Hit!).
+        self.assertEqual(day01.apply_rotation_closed_form(2, 98, 100), (0, 1))
+
+    def test_part2_closed_form_start_on_zero(self):
+        """Starting on zero should not count until a full lap is made."""
+        self.assertEqual(day01.apply_rotation_closed_form(99, 0, 100), (99, 0))
+        self.assertEqual(day01.apply_rotation_closed_form(-99, 0, 100), (1, 0))
+        self.assertEqual(day01.apply_rotation_closed_form(-100, 0, 100), (0, 1))
+
+    def test_part2_closed_form_huge_rotation(self):
+        """A rotation far too big to tick through."""
+        # Start 50, move +1_000_000_000. Zero at tick 50, then every 100 ticks.
+        self.assertEqual(day01.apply_rotation_closed_form(1_000_000_000, 50, 100), (50, 10_000_000))
+        self.assertEqual(day01.apply_rotation_closed_form(-1_000_000_000, 50, 100), (50, 10_000_000))
+
+    def test_part2_closed_form_full_scenario(self):
+        """Same scenario as the tick engine, selected through calculate_password."""
+        rotations = ['R5', 'L10', 'R20']
+        result = day01.calculate_password(5, rotations, 10, method=day01.Methods.part2_closed_form)
+        self.assertEqual(result, 4)
+
+    # ==========================================
+    # Vectorized Tests (NumPy)
+    # ==========================================
+
+    @unittest.skipIf(importlib.util.find_spec('numpy') is None, 'NumPy is not installed')
+    def test_vectorized_matches_loop(self):
+        """Both vectorized methods should match the loop methods on a mixed sequence."""
+        rotations = ['L68', 'L30', 'R48', 'L5', 'R60', 'L55', 'L1', 'L99', 'R14', 'L82', 'R200', 'L300', 'R0']
+        for start in (0, 1, 50, 99):
+            with self.subTest(start=start):
+                self.assertEqual(
+                    day01.calculate_password(start, rotations, 100, method=day01.Methods.part1_vectorized),
+                    day01.calculate_password(start, rotations, 100, method=day01.Methods.part1),
+                )
+                self.assertEqual(
+                    day01.calculate_password(start, rotations, 100, method=day01.Methods.part2_vectorized),
+                    day01.calculate_password(start, rotations, 100, method=day01.Methods.part2),
+                )
+
+    @unittest.skipIf(importlib.util.find_spec('numpy') is None, 'NumPy is not installed')
+    def test_vectorized_full_scenario(self):
+        """Same scenario as the tick engine, selected through calculate_password."""
+        rotations = ['R5', 'L10', 'R20']
+        self.assertEqual(day01.calculate_password(5, rotations, 10, method=day01.Methods.part1_vectorized), 3)
+        self.assertEqual(day01.calculate_password(5, rotations, 10, method=day01.Methods.part2_vectorized), 4)
+        self.assertEqual(day01.calculate_password(5, iter(rotations), 10, method=day01.Methods.part2_vectorized), 4)
+
+    # ==========================================
+    # Chunk Summary / Parallel Tests
+    # ==========================================
+
+    ROTATIONS = ['L68', 'L30', 'R48', 'L5', 'R60', 'L55', 'L1', 'L99', 'R14', 'L82', 'R200', 'L300', 'R0', 'L100']
+
+    def test_summarize_rotations_every_start(self):
+        """The summary table should match calculate_password for every starting value."""
+        steps = [day01.parse_line(rotation) for rotation in self.ROTATIONS]
+        for method, count_passes in ((day01.Methods.part1, False), (day01.Methods.part2_closed_form, True)):
+            summary = day01.summarize_rotations(steps, 100, count_passes)
+            self.assertEqual(summary.displacement, sum(steps))
+            for start in range(100):
+                with self.subTest(method=method, start=start):
+                    self.assertEqual(summary.zero_counts[start], day01.calculate_password(start, self.ROTATIONS, 100, method=method))
+
+    def test_summary_combine(self):
+        """Combining two summaries should equal summarizing both runs at once."""
+        steps = [day01.parse_line(rotation) for rotation in self.ROTATIONS]
+        for count_passes in (False, True):
+            left = day01.summarize_rotations(steps[:5], 100, count_passes)
+            right = day01.summarize_rotations(steps[5:], 100, count_passes)
+            whole = day01.summarize_rotations(steps, 100, count_passes)
+            combined = left.combine(right)
+            self.assertEqual(combined.displacement, whole.displacement)
+            self.assertEqual(combined.zero_counts, whole.zero_counts)
+
+    def test_calculate_passwords_all_starts(self):
+        """Both password tables should match calculate_password for every starting value."""
+        part_1_passwords, part_2_passwords = day01.calculate_passwords_all_starts(self.ROTATIONS, 10)
+        self.assertEqual(len(part_1_passwords), 10)
+        for start in range(10):
+            with self.subTest(start=start):
+                self.assertEqual(part_1_passwords[start], day01.calculate_password(start, self.ROTATIONS, 10, method=day01.Methods.part1))
+                self.assertEqual(part_2_passwords[start], day01.calculate_password(start, self.ROTATIONS, 10, method=day01.Methods.part2))
+
+    def test_calculate_position_histogram(self):
+        """Every position should be counted like ticking the lock one click at a time."""
+        for lock_size in (10, 100):
+            landed_counts = [0] * lock_size
+            passed_counts = [0] * lock_size
+            position = 7
+            for rotation in self.ROTATIONS:
+                rotation_step = day01.parse_line(rotation)
+                for _ in range(abs(rotation_step)):
+                    position = (position + (1 if rotation_step > 0 else -1)) % lock_size
+                    passed_counts[position] += 1
+                landed_counts[position] += 1
+
+            with self.subTest(lock_size=lock_size):
+                self.assertEqual(day01.calculate_position_histogram(7, self.ROTATIONS, lock_size), (landed_counts, passed_counts))
+
+        landed_counts, passed_counts = day01.calculate_position_histogram(50, self.ROTATIONS)
+        self.assertEqual(landed_counts[0], day01.calculate_password(50, self.ROTATIONS, method=day01.Methods.part1))
+        self.assertEqual(passed_counts[0], day01.calculate_password(50, self.ROTATIONS, method=day01.Methods.part2))
+        self.assertEqual(sum(landed_counts), len(self.ROTATIONS))
+
+    def test_calculate_password_parallel(self):
+        """The parallel solver should match the sequential one, in process and across a pool."""
+        for method in (day01.Methods.part1, day01.Methods.part2):
+            expected = day01.calculate_password(50, self.ROTATIONS, 100, method=method)
+            for workers in (1, 2):
+                with self.subTest(method=method, workers=workers):
+                    result = day01.calculate_password_parallel(50, self.ROTATIONS, 100, method=method, workers=workers, chunk_size=3)
+                    self.assertEqual(result, expected)
+
+
+    # ==========================================
+    # Rotation Index Tests
+    # ==========================================
+
+    def test_rotation_index_range_queries(self):
+        """Every range query should match running calculate_password on the slice from the right position."""
+        for method in (day01.Methods.part1, day01.Methods.part2):
+            index = day01.RotationIndex(self.ROTATIONS, 100, method=method, block_size=2)
+            for first in range(len(self.ROTATIONS) + 1):
+                position = 50
+                for rotation in self.ROTATIONS[:first]:
+                    position = (position + day01.parse_line(rotation)) % 100
+                for last in range(first, len(self.ROTATIONS) + 1):
+                    with self.subTest(method=method, first=first, last=last):
+                        expected = day01.calculate_password(position, self.ROTATIONS[first:last], 100, method=method)
+                        self.assertEqual(index.count_zeros(50, first, last), expected)
+
+    def test_rotation_index_update(self):
+        """Editing a rotation should give the same answers as rebuilding from scratch."""
+        for method in (day01.Methods.part1, day01.Methods.part2):
+            index = day01.RotationIndex(self.ROTATIONS, 100, method=method, block_size=2)
+            edited = list(self.ROTATIONS)
+            for position, rotation in ((0, 'R50'), (7, 'L250'), (13, 'R1')):
+                index.update(position, rotation)
+                edited[position] = rotation
+                with self.subTest(method=method, position=position):
+                    self.assertEqual(index.count_zeros(50), day01.calculate_password(50, edited, 100, method=method))
+                    self.assertEqual(index.count_zeros(50, 3, 11), day01.RotationIndex(edited, 100, method=method).count_zeros(50, 3, 11))
+
+    def test_rotation_index_invalid_range(self):
+        """Test that out of bounds ranges and indexes raise IndexError."""
+        index = day01.RotationIndex(self.ROTATIONS, 100)
+        with self.assertRaises(IndexError):
+            index.count_zeros(50, 5, 2)
+        with self.assertRaises(IndexError):
+            index.update(len(self.ROTATIONS), 'R1')
+
 
 if __name__ == '__main__':
     _ = unittest.main()
@@ -1,3 +1,59 @@
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from enum import StrEnum
+from itertools import chain, repeat
+
+
+class Methods(StrEnum):
+    part1 = 'calculate_only_repeating_number_sequences'
+    part1_arithmetic = 'sum_repeated_twice_ids'
+    part2 = 'calculate_repeated_block_sequences'
+    part2_arithmetic = 'sum_repeated_block_ids'
+    part1_index = 'RepeatedTwiceIndex.sum_range'
+    part1_vectorized = 'find_repeated_twice_mask'
+    digit_dp = 'count_and_sum_pattern'
+
+
+# Methods answering Part 2, every other method answers Part 1.
+PART2_METHODS: frozenset[Methods] = frozenset({Methods.part2, Methods.part2_arithmetic})
+
+
+# Streaming reader: bytes read per chunk, and the longest token ('lo-hi') accepted before giving up on the input.
+STREAM_BUFFER_SIZE: int = 1 << 16
+STREAM_MAX_TOKEN_SIZE: int = 1024
+
+# Index file, all little-endian: header, the sorted repeated-twice IDs as uint64, then their prefix sums as 16 byte integers.
+INDEX_MAGIC: bytes = b'AOC25D02'
+INDEX_HEADER: struct.Struct = struct.Struct('<8sqq')
+INDEX_SUM_SIZE: int = 16
+INDEX_BUILD_CHUNK_SIZE: int = 1 << 16
+
+# Stage -> functions instrumented with --timing and --memory (see Common.timing and Common.memory).
+TIMING_STAGES: dict[str, list[str]] = {
+    'read_input': ['read_input', 'read_input_ranges'],
+    'parse': ['parse_product_id_range', 'parse_product_id_ranges', 'merge_product_id_ranges', 'parse_product_id', 'parse_product_ids'],
+    'solve': [
+        'calculate_only_repeating_number_sequences',
+        'calculate_repeated_block_sequences',
+        'calculate_answer',
+        'sum_repeated_twice_ids',
+        'sum_repeated_block_ids',
+        'calculate_answer_vectorized',
+        'count_and_sum_pattern',
+        'calculate_answer_ranges',
+        'calculate_answer_parallel',
+    ],
+}
+
+# Number of IDs checked per NumPy block by the vectorized method.
+VECTORIZED_BLOCK_SIZE: int = 1 << 16
+
+
 def read_input(file_name: str) -> list[str]:
     """
     Read the input file and return a list of strings, split by comma.
@@ -13,11 +69,57 @@ def read_input(file_name: str) -> list[str]:
     return [id.strip() for id in all_ids if id.strip() != '']
 
 
-def parse_product_id(product_id: str) -> list[int]:
+def stream_product_id_ranges(file_name: str, buffer_size: int = STREAM_BUFFER_SIZE) -> Iterator[range]:
     """
-    Parse a product ID string into a list of integers.
+    Read the input file one buffer at a time and yield its ranges as they are tokenized, so memory stays bounded however long the line is.
+    :param file_name: ex: input.txt
+    :param buffer_size: Number of bytes read at a time.
+    :return: Iterator of ranges. ex: range(12, 13), range(345, 454)
+    """
+    with open(file_name, 'rb') as input_file:
+        pending: bytes = b''
+
+        while chunk := input_file.read(buffer_size):
+            tokens: list[bytes] = (pending + chunk).replace(b'\n', b',').split(b',')
+
+            # The last token may continue in the next chunk. It is held to the same limit as the others, so that limit bounds pending.
+            pending = tokens.pop().lstrip()
+            check_token_size(pending)
+
+            for token in tokens:
+                check_token_size(token)
+                product_id: str = token.decode().strip()
+                if product_id != '':
+                    yield parse_product_id_range(product_id)
+
+        product_id = pending.decode().strip()
+        if product_id != '':
+            yield parse_product_id_range(product_id)
+
+
+def check_token_size(token: bytes) -> None:
+    """
+    Reject a token of the streaming reader longer than STREAM_MAX_TOKEN_SIZE, whitespace around it excepted.
+    :param token: ex: b' 12-14'
+    """
+    if len(token.strip()) > STREAM_MAX_TOKEN_SIZE:
+        raise ValueError('Invalid product ID: ' + token.strip()[:32].decode(errors='replace') + '... - Token too long')
+
+
+def read_input_ranges(file_name: str) -> list[range]:
+    """
+    Read the input file into a list of ranges with the streaming reader.
+    :param file_name: ex: input.txt
+    :return: List of ranges. ex: [range(12, 13), range(345, 454)]
+    """
+    return list(stream_product_id_ranges(file_name))
+
+
+def parse_product_id_range(product_id: str) -> range:
+    """
+    Parse a product ID string into a range of integers, without materializing the IDs.
     :param product_id: ex: '12-14'
-    :return: List of integers representing the product ID. ex: [12, 13, 14]
+    :return: Range of the product IDs. ex: range(12, 15)
     """
     parsed_id: list[str] = [id.strip() for id in product_id.split('-') if id.strip() != '']
 
@@ -30,7 +132,44 @@ def parse_product_id(product_id: str) -> list[int]:
     if lower_bound > upper_bound:
         raise ValueError('Invalid product ID: ' + product_id + ' - Lower bound is greater than upper bound')
 
-    return list(range(lower_bound, upper_bound + 1))
+    return range(lower_bound, upper_bound + 1)
+
+
+def parse_product_id(product_id: str) -> list[int]:
+    """
+    Parse a product ID string into a list of integers.
+    :param product_id: ex: '12-14'
+    :return: List of integers representing the product ID. ex: [12, 13, 14]
+    """
+    return list(parse_product_id_range(product_id))
+
+
+def parse_product_id_ranges(product_ids: Iterable[str]) -> Iterator[range]:
+    """
+    Lazily parse product IDs into ranges, so no ID is materialized until a solver asks for it.
+    :param product_ids: Product IDs. ex: ['12-12', '13-14', '15-1168']
+    :return: Iterator of ranges. ex: range(12, 13), range(13, 15), range(15, 1169)
+    """
+    for product_id in product_ids:
+        yield parse_product_id_range(product_id)
+
+
+def merge_product_id_ranges(id_ranges: Iterable[range]) -> list[range]:
+    """
+    Sort the ranges and merge the overlapping or adjacent ones, so every ID is in exactly one range.
+    :param id_ranges: Ranges of product IDs. ex: [range(95, 116), range(11, 23), range(20, 31), range(31, 41)]
+    :return: Sorted, disjoint ranges. ex: [range(11, 41), range(95, 116)]
+    """
+    merged_ranges: list[range] = []
+
+    for id_range in sorted((id_range for id_range in id_ranges if len(id_range) > 0), key=lambda id_range: id_range.start):
+        if merged_ranges and id_range.start <= merged_ranges[-1].stop:
+            if id_range.stop > merged_ranges[-1].stop:
+                merged_ranges[-1] = range(merged_ranges[-1].start, id_range.stop)
+        else:
+            merged_ranges.append(id_range)
+
+    return merged_ranges
 
 
 def parse_product_ids(product_ids: list[str]) -> list[int]:
@@ -110,25 +249,620 @@ def calculate_only_repeating_number_sequences(id: int) -> list[int]:
     return []
 
 
-def calculate_answer(ids: list[int]) -> int:
-    invalid_ids: list[int] = []
+def calculate_repeated_block_sequences(id: int) -> list[int]:
+    """
+    Identify if the ENTIRE ID is made of a sequence repeated at least twice (e.g., 1212, 123123123, 1111111).
+    Returns a list containing the shortest such sequence if true, empty list otherwise.
+    """
+    id_str = str(id)
+    n = len(id_str)
+
+    for block_length in range(1, n // 2 + 1):
+        # The block has to fit a whole number of times (e.g., 12345 cannot be made of blocks of 2)
+        if n % block_length != 0:
+            continue
+
+        block = id_str[:block_length]
+        if block * (n // block_length) == id_str:
+            return [int(block)]
+
+    return []
+
+
+def calculate_answer(ids: Iterable[int], method: Methods = Methods.part1) -> int:
+    invalid_ids_sum: int = 0
+
+    match method:
+        case Methods.part1:
+            calculate_repeating_sequences = calculate_only_repeating_number_sequences
+        case Methods.part2:
+            calculate_repeating_sequences = calculate_repeated_block_sequences
+        case _:
+            raise ValueError('Invalid method for checking single IDs: ' + str(method))
 
     for id in ids:
-        repeating_sequences = calculate_only_repeating_number_sequences(id)
+        repeating_sequences = calculate_repeating_sequences(id)
         if len(repeating_sequences) > 0:
-            invalid_ids.append(id)
+            invalid_ids_sum += id
+
+    return invalid_ids_sum
+
+
+def sum_repeated_twice_ids(lower_bound: int, upper_bound: int) -> int:
+    """
+    Sum the IDs in [lower_bound, upper_bound] made of a sequence repeated twice, without checking them one by one.
+    An ID with an m digit half h is h * (10^m + 1), so for every m the matching halves form one interval, summed as an arithmetic series.
+    :param lower_bound: The lowest ID of the range (inclusive).
+    :param upper_bound: The highest ID of the range (inclusive).
+    :return: Sum of the invalid IDs in the range.
+    """
+    invalid_ids_sum: int = 0
+
+    for half_length in range(1, len(str(upper_bound)) // 2 + 1):
+        multiplier: int = 10**half_length + 1
+
+        lowest_half: int = max(10 ** (half_length - 1), -(-lower_bound // multiplier))
+        highest_half: int = min(10**half_length - 1, upper_bound // multiplier)
+
+        if lowest_half <= highest_half:
+            invalid_ids_sum += multiplier * (lowest_half + highest_half) * (highest_half - lowest_half + 1) // 2
+
+    return invalid_ids_sum
+
+
+def find_repeated_twice_mask(ids):
+    """
+    Identify which IDs are made of a sequence repeated twice, using only integer arithmetic on a NumPy int64 array.
+    The number of digits comes from comparing against powers of 10, then an ID with 2m digits is invalid when divmod(id, 10^m) gives two equal halves.
+    :param ids: NumPy int64 array of IDs. ex: np.array([11, 12, 1010])
+    :return: NumPy boolean array, True for the invalid IDs. ex: np.array([True, False, True])
+    """
+    import numpy as np
+
+    powers_of_ten = 10 ** np.arange(19, dtype=np.int64)
+    digit_counts = np.searchsorted(powers_of_ten, ids, side='right')
+    high_half, low_half = np.divmod(ids, powers_of_ten[digit_counts // 2])
+
+    return (digit_counts % 2 == 0) & (digit_counts > 0) & (high_half == low_half)
+
+
+def calculate_answer_vectorized(id_ranges: Iterable[range], block_size: int = VECTORIZED_BLOCK_SIZE) -> int:
+    """
+    Sum the IDs made of a sequence repeated twice, checking each range in NumPy blocks of block_size IDs.
+    :param id_ranges: Ranges of product IDs. ex: [range(11, 23), range(95, 116)]
+    :param block_size: Number of IDs per block, which bounds the memory used.
+    :return: Sum of the invalid IDs.
+    """
+    import numpy as np
+
+    invalid_ids_sum: int = 0
+
+    for id_range in id_ranges:
+        if id_range.stop - 1 > np.iinfo(np.int64).max:
+            raise ValueError('Invalid product ID: ' + str(id_range.stop - 1) + ' - Too large for the vectorized method')
+
+        for block_start in range(id_range.start, id_range.stop, block_size):
+            ids = np.arange(block_start, min(block_start + block_size, id_range.stop), dtype=np.int64)
+            invalid_ids_sum += sum(ids[find_repeated_twice_mask(ids)].tolist())
+
+    return invalid_ids_sum
+
+
+def mobius(n: int) -> int:
+    """
+    Möbius function: 0 if n has a squared prime factor, else (-1)^(number of prime factors).
+    :param n: ex: 6
+    :return: -1, 0 or 1. ex: 1
+    """
+    result: int = 1
+    factor: int = 2
+
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+
+    return -result if n > 1 else result
+
+
+def count_and_sum_block_ids(lower_bound: int, upper_bound: int, length: int, block_length: int) -> tuple[int, int]:
+    """
+    Count and sum the IDs in [lower_bound, upper_bound] with length digits made of a block of block_length digits repeated.
+    Such an ID is b * (1 + 10^block_length + 10^(2 * block_length) + ...), so the matching blocks b form one interval.
+    :param lower_bound: The lowest ID of the range (inclusive).
+    :param upper_bound: The highest ID of the range (inclusive).
+    :param length: Number of digits of the IDs, a multiple of block_length.
+    :param block_length: Number of digits of the repeated block.
+    :return: Tuple of (count, sum)
+    """
+    multiplier: int = (10**length - 1) // (10**block_length - 1)
+
+    lowest_block: int = max(10 ** (block_length - 1), -(-lower_bound // multiplier))
+    highest_block: int = min(10**block_length - 1, upper_bound // multiplier)
+
+    if lowest_block > highest_block:
+        return 0, 0
+
+    count: int = highest_block - lowest_block + 1
+    return count, multiplier * (lowest_block + highest_block) * count // 2
+
+
+def count_and_sum_repeated_block_ids(lower_bound: int, upper_bound: int) -> tuple[int, int]:
+    """
+    Count and sum the IDs in [lower_bound, upper_bound] made of a sequence repeated at least twice, without checking them one by one.
+    An ID like 111111 is made of blocks of 1, 2 and 3 digits, so the block lengths are combined with inclusion-exclusion:
+    for length n, the repeated IDs are -sum(mobius(k) * IDs made of blocks of n / k digits) over the divisors k > 1 of n.
+    :param lower_bound: The lowest ID of the range (inclusive).
+    :param upper_bound: The highest ID of the range (inclusive).
+    :return: Tuple of (count, sum)
+    """
+    invalid_ids_count: int = 0
+    invalid_ids_sum: int = 0
+
+    for length in range(2, len(str(upper_bound)) + 1):
+        for repeats in range(2, length + 1):
+            sign: int = mobius(repeats)
+            if length % repeats != 0 or sign == 0:
+                continue
+
+            count, total = count_and_sum_block_ids(lower_bound, upper_bound, length, length // repeats)
+            invalid_ids_count -= sign * count
+            invalid_ids_sum -= sign * total
+
+    return invalid_ids_count, invalid_ids_sum
 
-    return sum(invalid_ids)
+
+def sum_repeated_block_ids(lower_bound: int, upper_bound: int) -> int:
+    """
+    Sum the IDs in [lower_bound, upper_bound] made of a sequence repeated at least twice, without checking them one by one.
+    :param lower_bound: The lowest ID of the range (inclusive).
+    :param upper_bound: The highest ID of the range (inclusive).
+    :return: Sum of the invalid IDs in the range.
+    """
+    return count_and_sum_repeated_block_ids(lower_bound, upper_bound)[1]
+
+
+class DigitPattern:
+    """
+    A digit pattern for count_and_sum_pattern: IDs made of a block repeated block_repeats times, optionally also palindromes, using only the given digits.
+    ex: DigitPattern(2) is Part 1, DigitPattern(palindrome=True) are palindromes, DigitPattern(digits='13579') are IDs made of odd digits.
+    """
+
+    __slots__ = ('block_repeats', 'palindrome', 'digits')
+
+    def __init__(self, block_repeats: int = 1, palindrome: bool = False, digits: str = '0123456789'):
+        self.block_repeats: int = block_repeats
+        self.palindrome: bool = palindrome
+        self.digits: list[int] = sorted({int(digit) for digit in digits})
+
+    def positions(self, length: int) -> list[int] | None:
+        """
+        Group the digit positions of an ID of the given length that must hold the same digit.
+        :param length: Number of digits of the ID.
+        :return: For every position, the first position of its group, or None if no ID of this length can match.
+        """
+        if length % self.block_repeats != 0:
+            return None
+
+        block_length: int = length // self.block_repeats
+        groups: list[int] = [position % block_length for position in range(length)]
+
+        if self.palindrome:
+            # Merge the groups of mirrored positions until nothing changes (groups are tiny, so this stays cheap).
+            changed: bool = True
+            while changed:
+                changed = False
+                for position in range(length):
+                    first_group, second_group = groups[position], groups[length - 1 - position]
+                    if first_group != second_group:
+                        merged_group: int = min(first_group, second_group)
+                        groups = [merged_group if group in (first_group, second_group) else group for group in groups]
+                        changed = True
+
+        return groups
+
+    def matches(self, id: int) -> bool:
+        """
+        Check a single ID against the pattern, the slow way (used to verify count_and_sum_pattern).
+        :param id: ex: 123123
+        :return: True if the ID matches the pattern.
+        """
+        id_str = str(id)
+        groups = self.positions(len(id_str))
+
+        if groups is None:
+            return False
+
+        return all(int(digit) in self.digits and digit == id_str[groups[position]] for position, digit in enumerate(id_str))
+
+
+REPEATED_TWICE_PATTERN: DigitPattern = DigitPattern(block_repeats=2)
+
+
+def count_and_sum_pattern_length(bound: str, pattern: DigitPattern) -> tuple[int, int]:
+    """
+    Count and sum the IDs with len(bound) digits, up to bound, that match the pattern.
+    Digit DP walking the digits of bound while the prefix is still equal to it: every smaller digit at a free position
+    leaves the bound behind, and the remaining free groups can then take any allowed digit, counted in closed form.
+    :param bound: The highest ID as a string, without leading zeros. ex: '1188511890'
+    :param pattern: The pattern to match.
+    :return: Tuple of (count, sum)
+    """
+    length: int = len(bound)
+    groups: list[int] | None = pattern.positions(length)
+
+    if groups is None:
+        return 0, 0
+
+    weights: dict[int, int] = {}
+    for position, group in enumerate(groups):
+        weights[group] = weights.get(group, 0) + 10 ** (length - 1 - position)
+
+    # The group of the first digit cannot be 0.
+    allowed_digits: dict[int, list[int]] = {group: pattern.digits for group in weights}
+    allowed_digits[groups[0]] = [digit for digit in pattern.digits if digit != 0]
+
+    def count_and_sum_completions(assigned: dict[int, int]) -> tuple[int, int]:
+        count: int = 1
+        for group in weights:
+            if group not in assigned:
+                count *= len(allowed_digits[group])
+        if count == 0:
+            return 0, 0
+
+        total: int = count * sum(weights[group] * digit for group, digit in assigned.items())
+        for group in weights:
+            if group not in assigned:
+                total += weights[group] * sum(allowed_digits[group]) * (count // len(allowed_digits[group]))
+
+        return count, total
+
+    matching_count: int = 0
+    matching_sum: int = 0
+    assigned: dict[int, int] = {}
+
+    for position, bound_digit in enumerate(map(int, bound)):
+        group: int = groups[position]
+
+        if group in assigned:
+            if assigned[group] < bound_digit:
+                count, total = count_and_sum_completions(assigned)
+                return matching_count + count, matching_sum + total
+            if assigned[group] > bound_digit:
+                return matching_count, matching_sum
+            continue
+
+        for digit in allowed_digits[group]:
+            if digit >= bound_digit:
+                break
+            count, total = count_and_sum_completions({**assigned, group: digit})
+            matching_count += count
+            matching_sum += total
+
+        if bound_digit not in allowed_digits[group]:
+            return matching_count, matching_sum
+        assigned[group] = bound_digit
+
+    # Every digit followed the bound, so the bound itself matches.
+    return matching_count + 1, matching_sum + int(bound)
+
+
+def count_and_sum_pattern_up_to(upper_bound: int, pattern: DigitPattern) -> tuple[int, int]:
+    """
+    Count and sum the IDs in [1, upper_bound] that match the pattern.
+    :param upper_bound: The highest ID (inclusive).
+    :param pattern: The pattern to match.
+    :return: Tuple of (count, sum)
+    """
+    if upper_bound < 1:
+        return 0, 0
+
+    matching_count: int = 0
+    matching_sum: int = 0
+
+    for length in range(1, len(str(upper_bound))):
+        count, total = count_and_sum_pattern_length('9' * length, pattern)
+        matching_count += count
+        matching_sum += total
+
+    count, total = count_and_sum_pattern_length(str(upper_bound), pattern)
+    return matching_count + count, matching_sum + total
+
+
+def count_and_sum_pattern(lower_bound: int, upper_bound: int, pattern: DigitPattern = REPEATED_TWICE_PATTERN) -> tuple[int, int]:
+    """
+    Count and sum the IDs in [lower_bound, upper_bound] that match the pattern, in time polynomial in the number of digits.
+    :param lower_bound: The lowest ID of the range (inclusive).
+    :param upper_bound: The highest ID of the range (inclusive).
+    :param pattern: The pattern to match.
+    :return: Tuple of (count, sum)
+    """
+    upper_count, upper_sum = count_and_sum_pattern_up_to(upper_bound, pattern)
+    lower_count, lower_sum = count_and_sum_pattern_up_to(lower_bound - 1, pattern)
+
+    # 0 is the only ID starting with a 0.
+    zero_count: int = 1 if lower_bound <= 0 <= upper_bound and pattern.matches(0) else 0
+
+    return upper_count - lower_count + zero_count, upper_sum - lower_sum
+
+
+class RepeatedTwiceIndex:
+    """
+    Memory-mapped index of every ID made of a sequence repeated twice, up to digit_limit digits, with prefix sums.
+    Summing a range is two binary searches and a subtraction, and opening the index does not read it into memory.
+    """
+
+    __slots__ = ('digit_limit', 'count', 'index_file', 'index_map', 'ids')
+
+    def __init__(self, file_name: str):
+        self.index_file = open(file_name, 'rb')
+        try:
+            self.index_map: mmap.mmap = mmap.mmap(self.index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as error:
+            self.index_file.close()
+            raise ValueError('Invalid index file: ' + file_name) from error
+
+        if len(self.index_map) < INDEX_HEADER.size:
+            self.close()
+            raise ValueError('Invalid index file: ' + file_name)
+
+        magic, self.digit_limit, self.count = INDEX_HEADER.unpack_from(self.index_map)
+        if magic != INDEX_MAGIC or len(self.index_map) != INDEX_HEADER.size + self.count * (8 + INDEX_SUM_SIZE):
+            self.close()
+            raise ValueError('Invalid index file: ' + file_name)
+
+        self.ids: memoryview | array = memoryview(self.index_map)[INDEX_HEADER.size : INDEX_HEADER.size + 8 * self.count].cast('Q')
+        if sys.byteorder != 'little':
+            # The IDs are stored little-endian: big-endian machines read them into memory once, swapped.
+            little_endian_ids: memoryview = self.ids
+            self.ids = array('Q', little_endian_ids.tobytes())
+            self.ids.byteswap()
+            little_endian_ids.release()
+
+    def __enter__(self) -> 'RepeatedTwiceIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(getattr(self, 'ids', None), memoryview):
+            self.ids.release()
+        self.index_map.close()
+        self.index_file.close()
+
+    def prefix_sum(self, position: int) -> int:
+        """
+        Sum of the first position IDs of the index.
+        :param position: Number of IDs to sum, 0..count
+        :return: The sum.
+        """
+        if position == 0:
+            return 0
+
+        offset: int = INDEX_HEADER.size + 8 * self.count + INDEX_SUM_SIZE * (position - 1)
+        return int.from_bytes(self.index_map[offset : offset + INDEX_SUM_SIZE], 'little')
+
+    def sum_range(self, lower_bound: int, upper_bound: int) -> int:
+        """
+        Sum the IDs in [lower_bound, upper_bound] made of a sequence repeated twice.
+        :param lower_bound: The lowest ID of the range (inclusive).
+        :param upper_bound: The highest ID of the range (inclusive).
+        :return: Sum of the invalid IDs in the range.
+        """
+        if upper_bound >= 10**self.digit_limit:
+            raise ValueError('Invalid product ID: ' + str(upper_bound) + ' - Beyond the ' + str(self.digit_limit) + ' digit index')
+
+        return self.prefix_sum(bisect.bisect_right(self.ids, upper_bound)) - self.prefix_sum(bisect.bisect_left(self.ids, lower_bound))
+
+
+def build_repeated_twice_index(file_name: str, digit_limit: int = 12) -> None:
+    """
+    Write an index of every ID made of a sequence repeated twice with up to digit_limit digits, for RepeatedTwiceIndex.
+    IDs and prefix sums are written INDEX_BUILD_CHUNK_SIZE at a time, so the memory used does not grow with digit_limit,
+    and under a temporary name then renamed, so readers never see a half written index.
+    :param file_name: ex: repeated_twice.index
+    :param digit_limit: Largest number of digits of an indexed ID (at most 19, so IDs fit in uint64).
+    """
+    if not 1 <= digit_limit <= 19:
+        raise ValueError('Invalid digit limit: ' + str(digit_limit))
+
+    half_lengths: range = range(1, digit_limit // 2 + 1)
+    count: int = 10 ** half_lengths[-1] - 1 if half_lengths else 0
+
+    # Halves are enumerated in increasing order, so the IDs come out sorted.
+    # (multiplier, halves) chunks: an ID is its half times 10^half_length + 1.
+    chunks: list[tuple[int, range]] = [
+        (10**half_length + 1, range(chunk_start, min(chunk_start + INDEX_BUILD_CHUNK_SIZE, 10**half_length)))
+        for half_length in half_lengths
+        for chunk_start in range(10 ** (half_length - 1), 10**half_length, INDEX_BUILD_CHUNK_SIZE)
+    ]
+
+    temporary_name: str = file_name + '.' + str(os.getpid())
+    try:
+        with open(temporary_name, 'wb') as index_file:
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, digit_limit, count))
+
+            for multiplier, halves in chunks:
+                ids: array = array('Q', (half * multiplier for half in halves))
+                if sys.byteorder != 'little':
+                    ids.byteswap()
+                index_file.write(ids.tobytes())
+
+            running_sum: int = 0
+            for multiplier, halves in chunks:
+                prefix_sums: bytearray = bytearray()
+                for half in halves:
+                    running_sum += half * multiplier
+                    prefix_sums += running_sum.to_bytes(INDEX_SUM_SIZE, 'little')
+                index_file.write(prefix_sums)
+
+        os.replace(temporary_name, file_name)
+    except BaseException:
+        try:
+            os.remove(temporary_name)
+        except OSError:
+            pass
+        raise
+
+
+def calculate_answer_ranges(
+    id_ranges: Iterable[range],
+    method: Methods = Methods.part1,
+    keep_duplicates: bool = False,
+    index: RepeatedTwiceIndex | None = None,
+    pattern: DigitPattern = REPEATED_TWICE_PATTERN,
+) -> int:
+    """
+    Sum the invalid IDs of every range.
+    :param id_ranges: Ranges of product IDs. ex: [range(11, 23), range(95, 116)]
+    :param method: The method used to find the invalid IDs.
+    :param keep_duplicates: Count an ID once per range it is in (like calculate_answer(parse_product_ids(...))) instead of merging the ranges first.
+    :param index: The precomputed index, required by Methods.part1_index.
+    :param pattern: The digit pattern of the invalid IDs, used by Methods.digit_dp (default: Part 1).
+    :return: Sum of the invalid IDs.
+    """
+    if not keep_duplicates:
+        id_ranges = merge_product_id_ranges(id_ranges)
+
+    match method:
+        case Methods.part1 | Methods.part2:
+            return calculate_answer(chain.from_iterable(id_ranges), method)
+        case Methods.part1_arithmetic:
+            return sum(sum_repeated_twice_ids(id_range.start, id_range.stop - 1) for id_range in id_ranges)
+        case Methods.part2_arithmetic:
+            return sum(sum_repeated_block_ids(id_range.start, id_range.stop - 1) for id_range in id_ranges)
+        case Methods.part1_vectorized:
+            return calculate_answer_vectorized(id_ranges)
+        case Methods.digit_dp:
+            return sum(count_and_sum_pattern(id_range.start, id_range.stop - 1, pattern)[1] for id_range in id_ranges)
+        case Methods.part1_index:
+            if index is None:
+                raise ValueError('Invalid method: ' + str(method) + ' - No index given')
+            return sum(index.sum_range(id_range.start, id_range.stop - 1) for id_range in id_ranges)
+
+    raise ValueError('Invalid method: ' + str(method))
+
+
+def split_product_id_ranges(id_ranges: Iterable[range], task_count: int) -> list[list[tuple[int, int]]]:
+    """
+    Split ranges into task_count tasks covering about the same number of IDs each.
+    Wide ranges are cut into several tasks and tiny ranges are packed together, so every task costs about the same.
+    :param id_ranges: Ranges of product IDs. ex: [range(1, 101), range(200, 206)]
+    :param task_count: Number of tasks wanted.
+    :return: List of tasks, each a list of (start, stop) bounds. ex: [[(1, 54)], [(54, 101), (200, 206)]]
+    """
+    id_ranges = list(id_ranges)
+    total_ids: int = sum(len(id_range) for id_range in id_ranges)
+    task_size: int = max(1, -(-total_ids // max(1, task_count)))
+
+    tasks: list[list[tuple[int, int]]] = []
+    current_task: list[tuple[int, int]] = []
+    room: int = task_size
+
+    for id_range in id_ranges:
+        start, stop = id_range.start, id_range.stop
+        while start < stop:
+            end: int = min(stop, start + room)
+            current_task.append((start, end))
+            room -= end - start
+            start = end
+
+            if room == 0:
+                tasks.append(current_task)
+                current_task = []
+                room = task_size
+
+    if current_task:
+        tasks.append(current_task)
+
+    return tasks
+
+
+def calculate_answer_bounds(bounds: list[tuple[int, int]], method: Methods) -> int:
+    """
+    Sum the invalid IDs of a task from split_product_id_ranges. Only bounds are sent to the worker processes, never lists of IDs.
+    :param bounds: List of (start, stop) bounds. ex: [(11, 23), (95, 116)]
+    :param method: The method used to find the invalid IDs.
+    :return: Sum of the invalid IDs.
+    """
+    return calculate_answer_ranges((range(start, stop) for start, stop in bounds), method, keep_duplicates=True)
+
+
+def calculate_answer_parallel(
+    id_ranges: Iterable[range],
+    method: Methods = Methods.part1,
+    workers: int | None = None,
+    tasks_per_worker: int = 4,
+    keep_duplicates: bool = False,
+) -> int:
+    """
+    Sum the invalid IDs of every range, scanning balanced slices of the ranges across a process pool.
+    :param id_ranges: Ranges of product IDs. ex: [range(11, 23), range(95, 116)]
+    :param method: The method used to find the invalid IDs (any method but Methods.part1_index).
+    :param workers: Number of worker processes (default: os.cpu_count()). 1 runs in this process.
+    :param tasks_per_worker: Number of tasks per worker, a few per worker evens out the ones that run slower.
+    :param keep_duplicates: Count an ID once per range it is in, instead of merging the ranges first.
+    :return: Sum of the invalid IDs.
+    """
+    if not keep_duplicates:
+        id_ranges = merge_product_id_ranges(id_ranges)
+
+    workers = workers or os.cpu_count() or 1
+    tasks: list[list[tuple[int, int]]] = split_product_id_ranges(id_ranges, workers * tasks_per_worker)
+
+    if workers == 1 or len(tasks) <= 1:
+        return sum(calculate_answer_bounds(task, method) for task in tasks)
+
+    # Imported on first use, so importing this module does not pay for the process pool machinery.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(calculate_answer_bounds, tasks, repeat(method)))
 
 
 if __name__ == '__main__':
-    input_product_ids: list[str] = read_input('input.txt')
-    input_product_ids_parsed: list[int] = parse_product_ids(input_product_ids)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from functools import cache
+
+    from Common.cache import cached_answer, open_result_cache
+    from Common.memory import enable_memory_profiling
+    from Common.timing import enable_stage_timing
+
+    enable_stage_timing(globals(), TIMING_STAGES)
+    enable_memory_profiling(globals(), TIMING_STAGES)
+
+    input_file: str = 'input.txt'
+    result_cache = open_result_cache(__file__)
+
+    # Only read when an answer is not cached.
+    @cache
+    def load_ranges() -> list[range]:
+        return read_input_ranges(input_file)
 
     # --- Part 1 ---
-    password_part_1 = calculate_answer(input_product_ids_parsed)
+    password_part_1 = cached_answer(
+        result_cache,
+        input_file,
+        2,
+        1,
+        Methods.part1_arithmetic,
+        {},
+        lambda: calculate_answer_ranges(load_ranges(), Methods.part1_arithmetic),
+    )
     print(f'PW Part 1: {password_part_1}')
 
     # --- Part 2 ---
-    # password_part_2 = calculate_answer(input_product_ids_parsed)
-    # print(f'PW Part 2: {password_part_2}')
+    password_part_2 = cached_answer(
+        result_cache,
+        input_file,
+        2,
+        2,
+        Methods.part2_arithmetic,
+        {},
+        lambda: calculate_answer_ranges(load_ranges(), Methods.part2_arithmetic),
+    )
+    print(f'PW Part 2: {password_part_2}')
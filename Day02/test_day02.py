@@ -1,3 +1,6 @@
+import importlib.util
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 import Day02.main_day02 as day02
@@ -23,6 +26,54 @@ class TestSecretEntrance(unittest.TestCase):
             result = day02.read_input('dummy.txt')
         self.assertEqual(result, ['12-12', '345-453', '698-127', '15345-123'])
 
+    # --- Test: stream_product_id_ranges ---
+    def test_stream_product_id_ranges_matches_read_input(self):
+        """Streaming with a tiny buffer cuts tokens across reads but yields the same ranges."""
+        data = '11-22,95-115,\n\n  \n 998-1012,1188511880-1188511890 \n'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write(data)
+
+            expected = [day02.parse_product_id_range(product_id) for product_id in day02.read_input(file_name)]
+            for buffer_size in (1, 3, 7, 1 << 16):
+                with self.subTest(buffer_size=buffer_size):
+                    self.assertEqual(list(day02.stream_product_id_ranges(file_name, buffer_size)), expected)
+            self.assertEqual(day02.read_input_ranges(file_name), expected)
+
+    def test_stream_product_id_ranges_invalid(self):
+        """Invalid tokens raise ValueError like parse_product_id, and so do runaway tokens."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write('11-22,22-11')
+            with self.assertRaises(ValueError):
+                list(day02.stream_product_id_ranges(file_name))
+
+            with open(file_name, 'w') as input_file:
+                input_file.write('1' * (day02.STREAM_MAX_TOKEN_SIZE * 4))
+            with self.assertRaises(ValueError):
+                list(day02.stream_product_id_ranges(file_name, buffer_size=256))
+
+    def test_stream_product_id_ranges_token_size(self):
+        """The token limit gives the same result wherever the token falls relative to the read buffer."""
+        longest_token = '0' * (day02.STREAM_MAX_TOKEN_SIZE - 4) + '1-02'
+        too_long_token = '0' + longest_token
+        buffer_size = 4096
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            for offset in (0, 1, buffer_size - len(longest_token) - 1, buffer_size - 100, buffer_size - 1, buffer_size, buffer_size + 10):
+                padding = '5-5,' * (offset // 4) + ' ' * (offset % 4)
+                with self.subTest(offset=offset):
+                    with open(file_name, 'w') as input_file:
+                        input_file.write(padding + longest_token + ',7-7\n')
+                    self.assertEqual(list(day02.stream_product_id_ranges(file_name, buffer_size))[-2:], [range(1, 3), range(7, 8)])
+
+                    with open(file_name, 'w') as input_file:
+                        input_file.write(padding + too_long_token + ',7-7\n')
+                    with self.assertRaisesRegex(ValueError, 'Token too long'):
+                        list(day02.stream_product_id_ranges(file_name, buffer_size))
+
     # --- Test: parse_product_id ---
     def test_parse_product_id_single_item_range(self):
         """Test parsing a range where start equals end (e.g., 12-12)."""
@@ -51,6 +102,12 @@ class TestSecretEntrance(unittest.TestCase):
         with self.assertRaises(ValueError):
             day02.parse_product_id('14-12')
 
+    def test_parse_product_id_range(self):
+        """Test parsing into a lazy range with the same bounds and validation."""
+        self.assertEqual(day02.parse_product_id_range('12-14'), range(12, 15))
+        with self.assertRaises(ValueError):
+            day02.parse_product_id_range('14-12')
+
     # --- Test: parse_product_ids ---
     def test_parse_product_ids_standard(self):
         """Test parsing a list of product IDs with range expansion."""
@@ -61,6 +118,41 @@ class TestSecretEntrance(unittest.TestCase):
         result = day02.parse_product_ids(input_ids)
         self.assertEqual(result, [12, 5, 6, 7, 20, 21])
 
+    # --- Test: parse_product_id_ranges ---
+    def test_parse_product_id_ranges_is_lazy(self):
+        """Ranges are parsed one at a time, as the solver asks for them."""
+        result = day02.parse_product_id_ranges(iter(['12-12', '5-7', '14-12']))
+        self.assertEqual(next(result), range(12, 13))
+        self.assertEqual(next(result), range(5, 8))
+        with self.assertRaises(ValueError):
+            next(result)
+
+    # --- Test: merge_product_id_ranges ---
+    def test_merge_product_id_ranges(self):
+        """Overlapping, nested and adjacent ranges are merged, disjoint ones are kept apart."""
+        id_ranges = [range(95, 116), range(11, 23), range(20, 31), range(31, 41), range(12, 15), range(200, 201)]
+        result = day02.merge_product_id_ranges(id_ranges)
+        self.assertEqual(result, [range(11, 41), range(95, 116), range(200, 201)])
+
+    def test_calculate_answer_ranges_duplicates(self):
+        """Overlapping ranges count an ID once, unless keep_duplicates is set."""
+        product_ids = ['11-22', '20-33', '11-11']
+        methods = [day02.Methods.part1, day02.Methods.part1_arithmetic, day02.Methods.part2, day02.Methods.part2_arithmetic]
+        if importlib.util.find_spec('numpy') is not None:
+            methods.append(day02.Methods.part1_vectorized)
+        for method in methods:
+            with self.subTest(method=method):
+                merged = day02.calculate_answer_ranges(day02.parse_product_id_ranges(product_ids), method)
+                duplicates = day02.calculate_answer_ranges(day02.parse_product_id_ranges(product_ids), method, keep_duplicates=True)
+                self.assertEqual(merged, 11 + 22 + 33)
+                self.assertEqual(duplicates, 11 + 22 + 22 + 33 + 11)
+
+    def test_calculate_answer_ranges_lazy_pipeline(self):
+        """A wide range is checked without building a list of its IDs."""
+        id_ranges = day02.parse_product_id_ranges(['1-200000'])
+        expected = day02.sum_repeated_twice_ids(1, 200000)
+        self.assertEqual(day02.calculate_answer_ranges(id_ranges, day02.Methods.part1), expected)
+
     # --- Test: calculate_only_repeating_number_sequences ---
 
     def test_check_odd_length_ignored(self):
@@ -181,6 +273,229 @@ class TestSecretEntrance(unittest.TestCase):
         result = day02.calculate_answer(ids)
         self.assertEqual(result, 11 + 22 + 99 + 1010)
 
+    # --- Test: sum_repeated_twice_ids ---
+    def test_sum_repeated_twice_ids_instruction_example(self):
+        """Ranges from the instruction example."""
+        self.assertEqual(day02.sum_repeated_twice_ids(11, 22), 11 + 22)
+        self.assertEqual(day02.sum_repeated_twice_ids(95, 115), 99)
+        self.assertEqual(day02.sum_repeated_twice_ids(998, 1012), 1010)
+        self.assertEqual(day02.sum_repeated_twice_ids(1188511880, 1188511890), 1188511885)
+        self.assertEqual(day02.sum_repeated_twice_ids(1698522, 1698528), 0)
+
+    def test_sum_repeated_twice_ids_matches_brute_force(self):
+        """Compare against checking every ID, across several digit lengths."""
+        for lower_bound, upper_bound in [(1, 10), (1, 12000), (50, 150), (1000, 1000), (1010, 1010), (9999, 100100)]:
+            with self.subTest(lower_bound=lower_bound, upper_bound=upper_bound):
+                expected = day02.calculate_answer(range(lower_bound, upper_bound + 1))
+                self.assertEqual(day02.sum_repeated_twice_ids(lower_bound, upper_bound), expected)
+
+    def test_sum_repeated_twice_ids_huge_range(self):
+        """A range of billions of IDs: every 10 digit ID h * 100001 with a 5 digit half h."""
+        expected = 100001 * sum(range(10000, 100000))
+        self.assertEqual(day02.sum_repeated_twice_ids(10**9, 10**10 - 1), expected)
+
+    # --- Test: calculate_repeated_block_sequences (Part 2) ---
+    def test_repeated_block_sequences(self):
+        """IDs made of a block repeated at least twice return the shortest block."""
+        self.assertEqual(day02.calculate_repeated_block_sequences(12341234), [1234])
+        self.assertEqual(day02.calculate_repeated_block_sequences(123123123), [123])
+        self.assertEqual(day02.calculate_repeated_block_sequences(1212121212), [12])
+        self.assertEqual(day02.calculate_repeated_block_sequences(1111111), [1])
+        self.assertEqual(day02.calculate_repeated_block_sequences(111111), [1])
+
+    def test_repeated_block_sequences_not_repeated(self):
+        """IDs that are not a repeated block return an empty list."""
+        self.assertEqual(day02.calculate_repeated_block_sequences(7), [])
+        self.assertEqual(day02.calculate_repeated_block_sequences(12312), [])
+        self.assertEqual(day02.calculate_repeated_block_sequences(1698522), [])
+
+    # --- Test: count_and_sum_repeated_block_ids (Part 2) ---
+    def test_mobius(self):
+        """Möbius values for the first few integers."""
+        self.assertEqual([day02.mobius(n) for n in range(1, 11)], [1, -1, -1, 0, -1, 1, -1, 0, 0, 1])
+
+    def test_sum_repeated_block_ids_instruction_example(self):
+        """Ranges from the Part 2 instruction example."""
+        self.assertEqual(day02.sum_repeated_block_ids(11, 22), 11 + 22)
+        self.assertEqual(day02.sum_repeated_block_ids(95, 115), 99 + 111)
+        self.assertEqual(day02.sum_repeated_block_ids(998, 1012), 999 + 1010)
+        self.assertEqual(day02.sum_repeated_block_ids(565653, 565659), 565656)
+        self.assertEqual(day02.sum_repeated_block_ids(824824821, 824824827), 824824824)
+        self.assertEqual(day02.sum_repeated_block_ids(2121212118, 2121212124), 2121212121)
+
+    def test_count_and_sum_repeated_block_ids_no_double_counting(self):
+        """111111 is made of blocks of 1, 2 and 3 digits but is counted once."""
+        self.assertEqual(day02.count_and_sum_repeated_block_ids(111111, 111111), (1, 111111))
+
+    def test_count_and_sum_repeated_block_ids_matches_brute_force(self):
+        """Compare against checking every ID, across several digit lengths."""
+        for lower_bound, upper_bound in [(1, 10), (1, 150000), (990000, 1200000)]:
+            with self.subTest(lower_bound=lower_bound, upper_bound=upper_bound):
+                invalid_ids = [id for id in range(lower_bound, upper_bound + 1) if day02.calculate_repeated_block_sequences(id)]
+                expected = (len(invalid_ids), sum(invalid_ids))
+                self.assertEqual(day02.count_and_sum_repeated_block_ids(lower_bound, upper_bound), expected)
+
+    # --- Test: find_repeated_twice_mask (NumPy) ---
+    @unittest.skipIf(importlib.util.find_spec('numpy') is None, 'NumPy is not installed')
+    def test_find_repeated_twice_mask_matches_strings(self):
+        """The arithmetic mask should agree with the string check."""
+        import numpy as np
+
+        ids = np.array([0, 1, 11, 12, 99, 100, 1010, 1001, 123123, 123124, 1188511885, 999999999999999999, 4242424242424242], dtype=np.int64)
+        expected = [len(day02.calculate_only_repeating_number_sequences(int(id))) > 0 for id in ids]
+        self.assertEqual(day02.find_repeated_twice_mask(ids).tolist(), expected)
+
+    @unittest.skipIf(importlib.util.find_spec('numpy') is None, 'NumPy is not installed')
+    def test_calculate_answer_vectorized_blocks(self):
+        """Ranges split over several blocks give the same sum as the arithmetic method."""
+        id_ranges = [range(1, 12001), range(95, 116), range(1188511880, 1188511891)]
+        expected = sum(day02.sum_repeated_twice_ids(id_range.start, id_range.stop - 1) for id_range in id_ranges)
+        self.assertEqual(day02.calculate_answer_vectorized(id_ranges, block_size=1000), expected)
+        self.assertEqual(day02.calculate_answer_ranges(id_ranges, day02.Methods.part1_vectorized, keep_duplicates=True), expected)
+
+    @unittest.skipIf(importlib.util.find_spec('numpy') is None, 'NumPy is not installed')
+    def test_calculate_answer_vectorized_int64_limit(self):
+        """A range ending on the largest int64 is accepted, one ID past it is rejected."""
+        int64_max = 2**63 - 1
+        self.assertEqual(day02.calculate_answer_vectorized([range(int64_max - 10, int64_max + 1)]), 0)
+        with self.assertRaisesRegex(ValueError, 'Too large'):
+            day02.calculate_answer_vectorized([range(int64_max - 10, int64_max + 2)])
+
+    # --- Test: count_and_sum_pattern (Digit DP) ---
+    PATTERNS = [
+        day02.DigitPattern(block_repeats=2),
+        day02.DigitPattern(block_repeats=3),
+        day02.DigitPattern(palindrome=True),
+        day02.DigitPattern(digits='13579'),
+        day02.DigitPattern(block_repeats=2, palindrome=True, digits='012'),
+    ]
+
+    def test_digit_pattern_matches(self):
+        """Single IDs are checked against the pattern."""
+        self.assertTrue(day02.DigitPattern(block_repeats=2).matches(123123))
+        self.assertFalse(day02.DigitPattern(block_repeats=2).matches(123124))
+        self.assertTrue(day02.DigitPattern(palindrome=True).matches(12321))
+        self.assertFalse(day02.DigitPattern(palindrome=True).matches(12331))
+        self.assertTrue(day02.DigitPattern(digits='13579').matches(1357))
+        self.assertFalse(day02.DigitPattern(digits='13579').matches(1358))
+
+    def test_count_and_sum_pattern_matches_brute_force(self):
+        """Compare every pattern against checking every ID."""
+        for pattern in self.PATTERNS:
+            for lower_bound, upper_bound in [(0, 9), (1, 1), (11, 11), (1, 25000), (95, 115), (12000, 12999), (998877, 1001000)]:
+                with self.subTest(block_repeats=pattern.block_repeats, palindrome=pattern.palindrome, lower_bound=lower_bound, upper_bound=upper_bound):
+                    matching_ids = [id for id in range(lower_bound, upper_bound + 1) if pattern.matches(id)]
+                    expected = (len(matching_ids), sum(matching_ids))
+                    self.assertEqual(day02.count_and_sum_pattern(lower_bound, upper_bound, pattern), expected)
+
+    def test_count_and_sum_pattern_big_ints(self):
+        """Ranges with 30+ digits, checked against the closed forms."""
+        # Palindromes with n digits: 9 * 10^(ceil(n / 2) - 1)
+        count, _ = day02.count_and_sum_pattern(10**29, 10**35, day02.DigitPattern(palindrome=True))
+        self.assertEqual(count, sum(9 * 10 ** ((length + 1) // 2 - 1) for length in range(30, 36)))
+        # Repeated twice: matches the arithmetic method
+        lower_bound, upper_bound = 10**31 + 12345, 4 * 10**35 + 6789
+        expected = day02.sum_repeated_twice_ids(lower_bound, upper_bound)
+        self.assertEqual(day02.count_and_sum_pattern(lower_bound, upper_bound)[1], expected)
+
+    def test_calculate_answer_ranges_digit_dp(self):
+        """The digit DP method defaults to Part 1, and takes any pattern."""
+        id_ranges = [range(11, 23), range(95, 116), range(998, 1013)]
+        self.assertEqual(day02.calculate_answer_ranges(id_ranges, day02.Methods.digit_dp), 1142)
+        palindromes = day02.DigitPattern(palindrome=True)
+        self.assertEqual(day02.calculate_answer_ranges(id_ranges, day02.Methods.digit_dp, pattern=palindromes), 11 + 22 + 99 + 101 + 111 + 999 + 1001)
+
+    # --- Test: RepeatedTwiceIndex ---
+    def test_repeated_twice_index(self):
+        """Index lookups match the arithmetic engine, and ranges beyond the digit limit are rejected."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'repeated_twice.index')
+            day02.build_repeated_twice_index(file_name, digit_limit=6)
+
+            with day02.RepeatedTwiceIndex(file_name) as index:
+                self.assertEqual(index.count, 999)
+                self.assertEqual(list(index.ids[:10]), [11, 22, 33, 44, 55, 66, 77, 88, 99, 1010])
+                for lower_bound, upper_bound in [(1, 10), (11, 11), (11, 22), (95, 115), (998, 1012), (1, 999999), (123000, 124999)]:
+                    with self.subTest(lower_bound=lower_bound, upper_bound=upper_bound):
+                        expected = day02.sum_repeated_twice_ids(lower_bound, upper_bound)
+                        self.assertEqual(index.sum_range(lower_bound, upper_bound), expected)
+
+                with self.assertRaises(ValueError):
+                    index.sum_range(1, 10**6)
+
+                id_ranges = day02.parse_product_id_ranges(['11-22', '95-115', '998-1012'])
+                self.assertEqual(day02.calculate_answer_ranges(id_ranges, day02.Methods.part1_index, index=index), 1142)
+
+    def test_repeated_twice_index_invalid_file(self):
+        """A file that is not an index raises ValueError."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'input.txt')
+            with open(file_name, 'w') as input_file:
+                input_file.write('11-22,95-115' * 10)
+            with self.assertRaises(ValueError):
+                day02.RepeatedTwiceIndex(file_name)
+
+            # mmap refuses empty files, which should be reported the same way.
+            open(file_name, 'w').close()
+            with self.assertRaisesRegex(ValueError, 'Invalid index file'):
+                day02.RepeatedTwiceIndex(file_name)
+
+    def test_build_repeated_twice_index_chunks(self):
+        """Building in small chunks writes the same index, and leaves no temporary file behind."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            whole_name = os.path.join(tmp_dir, 'whole.index')
+            chunked_name = os.path.join(tmp_dir, 'chunked.index')
+            day02.build_repeated_twice_index(whole_name, digit_limit=6)
+            with patch.object(day02, 'INDEX_BUILD_CHUNK_SIZE', 7):
+                day02.build_repeated_twice_index(chunked_name, digit_limit=6)
+
+            with open(whole_name, 'rb') as whole_file, open(chunked_name, 'rb') as chunked_file:
+                self.assertEqual(whole_file.read(), chunked_file.read())
+            self.assertEqual(sorted(os.listdir(tmp_dir)), ['chunked.index', 'whole.index'])
+
+    def test_calculate_answer_ranges_index_required(self):
+        """Methods.part1_index needs an index."""
+        with self.assertRaises(ValueError):
+            day02.calculate_answer_ranges([range(11, 23)], day02.Methods.part1_index)
+
+    # --- Test: calculate_answer_ranges ---
+    def test_calculate_answer_ranges_every_method(self):
+        """Every method should give the same answer on the example ranges."""
+        id_ranges = [day02.parse_product_id_range(product_id) for product_id in ['11-22', '95-115', '998-1012', '1188511880-1188511890']]
+        part1_methods = [day02.Methods.part1, day02.Methods.part1_arithmetic]
+        if importlib.util.find_spec('numpy') is not None:
+            part1_methods.append(day02.Methods.part1_vectorized)
+        for method in part1_methods:
+            with self.subTest(method=method):
+                self.assertEqual(day02.calculate_answer_ranges(id_ranges, method), 11 + 22 + 99 + 1010 + 1188511885)
+        for method in (day02.Methods.part2, day02.Methods.part2_arithmetic):
+            with self.subTest(method=method):
+                self.assertEqual(day02.calculate_answer_ranges(id_ranges, method), 11 + 22 + 99 + 111 + 999 + 1010 + 1188511885)
+
+    # --- Test: calculate_answer_parallel ---
+    def test_split_product_id_ranges_balanced(self):
+        """Wide ranges are cut and tiny ones packed, so every task but the last has the same number of IDs."""
+        id_ranges = [range(1, 1001), range(2000, 2003), range(3000, 3002), range(5000, 5600)]
+        tasks = day02.split_product_id_ranges(id_ranges, 4)
+        sizes = [sum(stop - start for start, stop in task) for task in tasks]
+        self.assertEqual(len(tasks), 4)
+        self.assertEqual(sizes, [402, 402, 402, 399])
+        self.assertEqual([bound for task in tasks for bound in task][0], (1, 403))
+
+    def test_calculate_answer_parallel(self):
+        """The parallel scan matches the arithmetic methods, in process and across a pool."""
+        id_ranges = [range(1, 30001), range(95, 116), range(1188511880, 1188511891)]
+        for method, arithmetic in ((day02.Methods.part1, day02.Methods.part1_arithmetic), (day02.Methods.part2, day02.Methods.part2_arithmetic)):
+            expected = day02.calculate_answer_ranges(id_ranges, arithmetic)
+            for workers in (1, 2):
+                with self.subTest(method=method, workers=workers):
+                    self.assertEqual(day02.calculate_answer_parallel(id_ranges, method, workers=workers), expected)
+
+    def test_calculate_answer_invalid_method(self):
+        """Arithmetic methods work on ranges, not on single IDs."""
+        with self.assertRaises(ValueError):
+            day02.calculate_answer([11, 22], day02.Methods.part1_arithmetic)
+
     # # --- Test: calculate_answer (Integration) ---
     # def test_calculate_answer_mixed(self):
     #     """